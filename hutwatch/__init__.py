@@ -1,3 +1,21 @@
 """HutWatch - BLE temperature monitoring with Telegram bot."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .app import HutWatchApp
+
 __version__ = "0.4.0"
+
+__all__ = ["HutWatchApp", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import HutWatchApp on first access so `import hutwatch` stays light."""
+    if name == "HutWatchApp":
+        from .app import HutWatchApp
+
+        return HutWatchApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
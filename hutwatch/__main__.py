@@ -5,36 +5,43 @@ import asyncio
 import logging
 import sys
 from pathlib import Path
-
-from .app import HutWatchApp
+from typing import Callable, Coroutine
 
 
 def setup_logging(verbose: bool, quiet: bool = False) -> None:
     """Configure logging."""
+    root = logging.getLogger()
+
     if quiet:
         # TUI mode: suppress all log output to avoid corrupting the display
-        logging.basicConfig(level=logging.CRITICAL + 1)
+        root.setLevel(logging.CRITICAL + 1)
         return
 
     level = logging.DEBUG if verbose else logging.INFO
     format_str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-    logging.basicConfig(
-        level=level,
-        format=format_str,
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter(format_str))
+    root.addHandler(handler)
+    root.setLevel(level)
 
     # Reduce noise from libraries
     logging.getLogger("bleak").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("telegram").setLevel(logging.WARNING)
 
-    try:
-        import telegram  # noqa: F401
 
-        logging.getLogger("telegram").setLevel(logging.WARNING)
-    except ImportError:
-        pass
+def get_runner() -> Callable[[Coroutine], object]:
+    """Return uvloop.run when uvloop is installed, else asyncio.run."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:  # Optional speedup: pip install hutwatch[speedups]
+            pass
+        else:
+            logging.getLogger(__name__).debug("Using uvloop event loop")
+            return uvloop.run
+    return asyncio.run
 
 
 def parse_args() -> argparse.Namespace:
@@ -134,20 +141,23 @@ def main() -> int:
         return 1
 
     # Determine language: CLI --lang overrides config file
-    import yaml
+    from .config import read_config_file
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        raw_config = yaml.safe_load(f) or {}
+    raw_config = read_config_file(config_path)
     lang = args.lang or raw_config.get("language", "fi")
 
     from .i18n import init_lang
 
     init_lang(lang)
 
+    # Deferred so --help, --demo and a missing config don't pay for the
+    # bleak/aiohttp/telegram import chain
+    from .app import HutWatchApp
+
     # Run the application
     try:
         app = HutWatchApp(config_path, console_interval=args.console, use_tui=args.tui, api_port=args.api_port, show_hidden=args.show_hidden)
-        asyncio.run(app.run())
+        get_runner()(app.run())
         return 0
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
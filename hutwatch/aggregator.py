@@ -25,6 +25,12 @@ AGGREGATION_INTERVAL = 300
 WEATHER_FETCH_INTERVAL = 3600
 
 
+def _round_to_interval(now: datetime) -> datetime:
+    """Round down to the 5-minute aggregation boundary using integer arithmetic."""
+    bucket_ts = int(now.timestamp()) // AGGREGATION_INTERVAL * AGGREGATION_INTERVAL
+    return datetime.fromtimestamp(bucket_ts)
+
+
 class Aggregator:
     """Aggregates sensor data and saves to database periodically."""
 
@@ -78,7 +84,7 @@ class Aggregator:
         """Fetch weather on demand. Returns True if successful."""
         if not self._weather:
             return False
-        await self._fetch_weather()
+        await self._fetch_weather(force=True)
         return self._weather.latest is not None
 
     async def stop(self) -> None:
@@ -119,60 +125,74 @@ class Aggregator:
     async def _aggregate(self) -> None:
         """Aggregate and save data for all sensors."""
         now = datetime.now()
-        # Round to 5-minute boundary
-        timestamp = now.replace(
-            minute=(now.minute // 5) * 5,
-            second=0,
-            microsecond=0,
-        )
+        timestamp = _round_to_interval(now)
+
+        cutoff = now - timedelta(seconds=AGGREGATION_INTERVAL)
+        rows: list[dict] = []
+        latest_readings = self._store.get_all_latest()
 
         for sensor_config in self._config.sensors:
             mac = sensor_config.mac
 
-            # Get recent readings from store
-            readings = self._store.get_history(mac, hours=1)
+            # Skip sensors with nothing new since the last aggregation
+            latest = latest_readings.get(mac)
+            if latest is None or latest.timestamp < cutoff:
+                continue
+            last_aggregated = self._last_aggregation.get(mac)
+            if last_aggregated is not None and latest.timestamp <= last_aggregated:
+                continue
 
-            # Filter to last 5 minutes
-            cutoff = now - timedelta(seconds=AGGREGATION_INTERVAL)
-            recent = [r for r in readings if r.timestamp >= cutoff]
+            # Get readings from the last 5 minutes
+            recent = self._store.get_history_since(mac, cutoff)
 
             if not recent:
                 continue
 
-            # Calculate aggregates
-            temps = [r.temperature for r in recent]
-            temp_avg = sum(temps) / len(temps)
-            temp_min = min(temps)
-            temp_max = max(temps)
-
-            humidity_avg = None
-            humidities = [r.humidity for r in recent if r.humidity is not None]
-            if humidities:
-                humidity_avg = sum(humidities) / len(humidities)
-
-            pressure_avg = None
-            pressures = [r.pressure for r in recent if r.pressure is not None]
-            if pressures:
-                pressure_avg = sum(pressures) / len(pressures)
+            # Calculate aggregates in a single pass
+            temp_sum = 0.0
+            temp_min = temp_max = recent[0].temperature
+            hum_sum = 0.0
+            hum_count = 0
+            pres_sum = 0.0
+            pres_count = 0
+            for r in recent:
+                temp = r.temperature
+                temp_sum += temp
+                if temp < temp_min:
+                    temp_min = temp
+                elif temp > temp_max:
+                    temp_max = temp
+                hum = r.humidity
+                if hum is not None:
+                    hum_sum += hum
+                    hum_count += 1
+                pres = r.pressure
+                if pres is not None:
+                    pres_sum += pres
+                    pres_count += 1
+
+            temp_avg = temp_sum / len(recent)
+            humidity_avg = hum_sum / hum_count if hum_count else None
+            pressure_avg = pres_sum / pres_count if pres_count else None
 
             # Get latest battery info
             latest = recent[-1]
             battery_voltage = latest.battery_voltage
             battery_percent = latest.battery_percent
-
-            # Save to database
-            self._db.save_aggregated_reading(
-                mac=mac,
-                timestamp=timestamp,
-                temp_avg=temp_avg,
-                temp_min=temp_min,
-                temp_max=temp_max,
-                humidity_avg=humidity_avg,
-                pressure_avg=pressure_avg,
-                battery_voltage=battery_voltage,
-                battery_percent=battery_percent,
-                sample_count=len(recent),
-            )
+            self._last_aggregation[mac] = latest.timestamp
+
+            rows.append({
+                "mac": mac,
+                "timestamp": timestamp,
+                "temp_avg": temp_avg,
+                "temp_min": temp_min,
+                "temp_max": temp_max,
+                "humidity_avg": humidity_avg,
+                "pressure_avg": pressure_avg,
+                "battery_voltage": battery_voltage,
+                "battery_percent": battery_percent,
+                "sample_count": len(recent),
+            })
 
             logger.debug(
                 "Aggregated %d readings for %s: %.1f°C (min=%.1f, max=%.1f)",
@@ -183,6 +203,9 @@ class Aggregator:
                 temp_max,
             )
 
+        # Save all sensors in one transaction
+        self._db.save_aggregated_readings(rows)
+
         # Check alert thresholds
         if self._alert_manager and self._alert_callback:
             try:
@@ -214,7 +237,7 @@ class Aggregator:
                                 if mac not in current_readings:
                                     current_readings[mac] = SensorReading(
                                         mac=mac,
-                                        timestamp=datetime.now(),
+                                        timestamp=now,
                                         temperature=sensor.temperature,
                                         humidity=sensor.humidity,
                                     )
@@ -228,32 +251,35 @@ class Aggregator:
 
     async def _run_weather(self) -> None:
         """Weather fetch loop."""
-        # Fetch immediately on start
+        # Fetch immediately on start; a cached forecast only waits out its remaining interval
         await self._fetch_weather()
+        delay = WEATHER_FETCH_INTERVAL
+        last_fetch = self._weather.last_fetch if self._weather else None
+        if last_fetch:
+            age = (datetime.now() - last_fetch).total_seconds()
+            delay = min(max(WEATHER_FETCH_INTERVAL - age, 0), WEATHER_FETCH_INTERVAL)
 
         while self._running:
             try:
-                await asyncio.sleep(WEATHER_FETCH_INTERVAL)
+                await asyncio.sleep(delay)
+                delay = WEATHER_FETCH_INTERVAL
                 await self._fetch_weather()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error("Weather fetch error: %s", e)
 
-    async def _fetch_weather(self) -> None:
+    async def _fetch_weather(self, force: bool = False) -> None:
         """Fetch and save weather data."""
         if not self._weather:
             return
 
-        weather = await self._weather.fetch()
-        if weather:
-            # Round timestamp to 5-minute boundary
-            now = datetime.now()
-            timestamp = now.replace(
-                minute=(now.minute // 5) * 5,
-                second=0,
-                microsecond=0,
-            )
+        previous_fetch = self._weather.last_fetch
+        weather = await self._weather.fetch(force=force)
+        # A cache hit is already in the history under its original fetch time
+        last_fetch = self._weather.last_fetch
+        if weather and last_fetch and last_fetch != previous_fetch:
+            timestamp = _round_to_interval(last_fetch)
 
             self._db.save_weather(
                 timestamp=timestamp,
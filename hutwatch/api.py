@@ -2,23 +2,54 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 from aiohttp import web
 
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install hutwatch[speedups]
+    orjson = None  # type: ignore[assignment]
+
 from . import __version__
 from .ble.sensor_store import SensorStore
 from .db import Database
+from .formatting import format_db_timestamp
 from .models import AppConfig
-from .weather import WeatherFetcher
 
 if TYPE_CHECKING:
     from .remote import RemotePoller
+    from .weather import WeatherFetcher
 
 logger = logging.getLogger(__name__)
 
+# Seconds a built status payload is reused, absorbing bursts of API/peer requests
+STATUS_CACHE_TTL = 1.0
+
+
+def _json_dumps(data: object) -> bytes:
+    """Encode JSON to bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _json_loads(data: str | bytes) -> object:
+    """Decode JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_response(data: object, status: int = 200) -> web.Response:
+    """Build a JSON response with _json_dumps."""
+    return web.Response(body=_json_dumps(data), status=status, content_type="application/json")
+
 
 def build_status_payload(
     config: AppConfig,
@@ -31,13 +62,17 @@ def build_status_payload(
     Shared by GET /status response and POST /sync outgoing data.
     """
     now = datetime.now()
+    now_ts = now.timestamp()
     readings = store.get_all_latest()
+    # Already ordered by display_order
     devices = db.get_all_devices(include_hidden=True)
+    # Built per call: config.sensors grows as new sensors are discovered
+    sensor_by_mac = {s.mac: s for s in config.sensors}
 
     sensors = []
-    for d in sorted(devices, key=lambda x: x.display_order):
+    for d in devices:
         reading = readings.get(d.mac)
-        sensor_config = config.get_sensor_by_mac(d.mac)
+        sensor_config = sensor_by_mac.get(d.mac)
         name = d.get_display_name()
         if not name or name == d.mac:
             name = sensor_config.name if sensor_config else d.mac
@@ -50,12 +85,12 @@ def build_status_payload(
         }
 
         if reading:
-            age = (now - reading.timestamp).total_seconds()
+            age = now_ts - reading.ts
             entry["temperature"] = reading.temperature
             entry["humidity"] = reading.humidity
             entry["battery_percent"] = reading.battery_percent
             entry["battery_voltage"] = reading.battery_voltage
-            entry["timestamp"] = reading.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+            entry["timestamp"] = format_db_timestamp(reading.timestamp)
             entry["age_seconds"] = int(age)
         else:
             entry["temperature"] = None
@@ -66,7 +101,7 @@ def build_status_payload(
     site_name = db.get_setting("site_name") or None
 
     output: dict = {
-        "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
+        "timestamp": format_db_timestamp(now),
         "site_name": site_name,
         "sensors": sensors,
     }
@@ -82,13 +117,48 @@ def build_status_payload(
             "precipitation": w.precipitation,
             "cloud_cover": w.cloud_cover,
             "symbol_code": w.symbol_code,
-            "timestamp": w.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": format_db_timestamp(w.timestamp),
             "location": weather.location_name,
         }
 
     return output
 
 
+def _status_etag(output: dict) -> str:
+    """Hash the payload without its per-second fields (response time, sensor ages).
+
+    The ETag then changes only when a reading, device or weather value does,
+    so pollers can get 304 between sensor updates.
+    """
+    stable = {
+        **output,
+        "timestamp": None,
+        "sensors": [{**s, "age_seconds": None} for s in output.get("sensors", [])],
+    }
+    return f'"{hashlib.blake2b(_json_dumps(stable), digest_size=8).hexdigest()}"'
+
+
+class StatusCache:
+    """Callable that memoizes a status payload builder for a short TTL.
+
+    One instance is shared by ApiServer and RemotePoller so HTTP clients and
+    outgoing peer syncs reuse the same payload. Returned dicts must not be mutated.
+    """
+
+    def __init__(self, build_fn: Callable[[], dict], ttl: float = STATUS_CACHE_TTL) -> None:
+        self._build_fn = build_fn
+        self._ttl = ttl
+        self._payload: Optional[dict] = None
+        self._built_at = 0.0
+
+    def __call__(self) -> dict:
+        now = time.monotonic()
+        if self._payload is None or now - self._built_at >= self._ttl:
+            self._payload = self._build_fn()
+            self._built_at = now
+        return self._payload
+
+
 class ApiServer:
     """aiohttp web server exposing sensor and weather data as JSON."""
 
@@ -99,14 +169,19 @@ class ApiServer:
         db: Database,
         weather: Optional[WeatherFetcher],
         port: int,
+        status_fn: Optional[Callable[[], dict]] = None,
     ) -> None:
         self._config = config
         self._store = store
         self._db = db
         self._weather = weather
         self._port = port
+        self._status_fn = status_fn or StatusCache(
+            lambda: build_status_payload(self._config, self._store, self._db, self._weather)
+        )
         self._runner: Optional[web.AppRunner] = None
         self._remote: Optional[RemotePoller] = None
+        self._status_body: Optional[tuple[dict, bytes, str]] = None  # (payload, body, etag)
 
     def set_weather(self, weather: WeatherFetcher) -> None:
         """Update weather fetcher reference (called from app.setup_weather)."""
@@ -138,12 +213,11 @@ class ApiServer:
 
     async def _handle_health(self, request: web.Request) -> web.Response:
         """Health check endpoint."""
-        return web.json_response({"status": "ok", "version": __version__})
+        return _json_response({"status": "ok", "version": __version__})
 
     async def _handle_status(self, request: web.Request) -> web.Response:
         """Return current sensor readings and weather as JSON."""
-        output = build_status_payload(self._config, self._store, self._db, self._weather)
-        return web.json_response(output)
+        return self._status_response(request)
 
     async def _handle_sync(self, request: web.Request) -> web.Response:
         """Bidirectional peer sync: receive peer data, return own data.
@@ -151,9 +225,9 @@ class ApiServer:
         The peer POSTs its local status; we store it and return ours.
         """
         try:
-            peer_data = await request.json()
+            peer_data = await request.json(loads=_json_loads)
         except Exception:
-            return web.json_response({"error": "invalid JSON"}, status=400)
+            return _json_response({"error": "invalid JSON"}, status=400)
 
         # Store the incoming peer data
         peer_site_name = peer_data.get("site_name") or "unknown"
@@ -161,6 +235,24 @@ class ApiServer:
             self._remote.receive_peer_data(peer_site_name, peer_data)
             logger.debug("Received sync from peer: %s", peer_site_name)
 
-        # Return our own status
-        output = build_status_payload(self._config, self._store, self._db, self._weather)
-        return web.json_response(output)
+        # Return our own status; a POST with side effects is never answered 304
+        return self._status_response(request, conditional=False)
+
+    def _status_response(self, request: web.Request, conditional: bool = True) -> web.Response:
+        """Build the status response, re-encoding JSON only when the payload changed.
+
+        With conditional set (GET /status), sends an ETag and answers 304 Not
+        Modified when the client already has the current one.
+        """
+        output = self._status_fn()
+        cached = self._status_body
+        if cached is None or cached[0] is not output:
+            cached = (output, _json_dumps(output), _status_etag(output))
+            self._status_body = cached
+
+        _, body, etag = cached
+        if not conditional:
+            return web.Response(body=body, content_type="application/json")
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
@@ -3,35 +3,51 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import importlib.util
 import logging
 import signal
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
 from .aggregator import Aggregator
 from .alerts import AlertManager
-from .api import ApiServer, build_status_payload
 from .ble.scanner import BleScanner
 from .ble.sensor_store import SensorStore
 from .config import load_config
-from .console import ConsoleReporter
 from .db import Database
 from .i18n import t
 from .models import AppConfig, WeatherConfig
-from .remote import RemotePoller
-from .tui import TuiDashboard
-from .weather import WeatherFetcher
 
-try:
-    from .telegram.bot import TelegramBot
+# Probe for python-telegram-bot without importing it; the bot module is
+# only imported when Telegram is actually configured
+_HAS_TELEGRAM = importlib.util.find_spec("telegram") is not None
+
+if TYPE_CHECKING:
+    import aiohttp
 
-    _HAS_TELEGRAM = True
-except ImportError:
-    TelegramBot = None  # type: ignore[assignment,misc]
-    _HAS_TELEGRAM = False
+    from .api import ApiServer
+    from .console import ConsoleReporter
+    from .remote import RemotePoller
+    from .telegram.bot import TelegramBot
+    from .tui import TuiDashboard
+    from .weather import WeatherFetcher
 
 logger = logging.getLogger(__name__)
 
+# Max seconds to wait for the Telegram bot to connect during startup
+BOT_START_TIMEOUT = 10.0
+
+# Max seconds to wait for cancelled background tasks on shutdown
+TASK_CANCEL_TIMEOUT = 5.0
+
+# Upper bound for the backoff before restarting a crashed background task
+TASK_RESTART_MAX_DELAY = 60
+
+# A task that ran at least this long before failing restarts with the backoff reset
+TASK_HEALTHY_SECONDS = 600
+
 
 class HutWatchApp:
     """Main application that coordinates all components."""
@@ -58,15 +74,17 @@ class HutWatchApp:
         self._aggregator: Optional[Aggregator] = None
         self._alert_manager: Optional[AlertManager] = None
         self._weather: Optional[WeatherFetcher] = None
-        self._bot: Optional["TelegramBot"] = None
+        self._bot: Optional[TelegramBot] = None
         self._console: Optional[ConsoleReporter] = None
         self._tui: Optional[TuiDashboard] = None
         self._api: Optional[ApiServer] = None
         self._remote: Optional[RemotePoller] = None
+        self._http: Optional[aiohttp.ClientSession] = None
         self._running = False
         self._shutdown_event: Optional[asyncio.Event] = None
         self._scanner_task: Optional[asyncio.Task] = None
         self._bot_task: Optional[asyncio.Task] = None
+        self._weather_refresh: Optional[asyncio.Task] = None
 
     async def start(self) -> None:
         """Start all components."""
@@ -82,14 +100,18 @@ class HutWatchApp:
         # Sync devices from config to database
         self._db.sync_devices_from_config(self._config.sensors)
 
+        # Independent component startups, awaited together below
+        startup = []
+
         # Initialize weather fetcher if configured
         if not self._config.weather:
             # Try loading weather location from database
-            lat_str = self._db.get_setting("weather_lat")
-            lon_str = self._db.get_setting("weather_lon")
+            settings = self._db.get_settings(("weather_lat", "weather_lon", "weather_name"))
+            lat_str = settings.get("weather_lat")
+            lon_str = settings.get("weather_lon")
             if lat_str and lon_str:
                 try:
-                    name = self._db.get_setting("weather_name") or t("common_weather_default_name")
+                    name = settings.get("weather_name") or t("common_weather_default_name")
                     self._config.weather = WeatherConfig(
                         latitude=float(lat_str),
                         longitude=float(lon_str),
@@ -100,8 +122,12 @@ class HutWatchApp:
                     pass
 
         if self._config.weather:
-            self._weather = WeatherFetcher(self._config.weather)
-            await self._weather.start()
+            from .weather import WeatherFetcher
+
+            self._weather = WeatherFetcher(
+                self._config.weather, db=self._db, session=self._http_session(),
+            )
+            startup.append(self._weather.start())
             logger.info(
                 "Weather configured for %s (%.4f, %.4f)",
                 self._config.weather.location_name,
@@ -117,26 +143,39 @@ class HutWatchApp:
         # Initialize alert manager (wired to aggregator after remote poller is created)
         self._alert_manager = AlertManager(self._db)
 
-        # Start API server if configured (CLI --api-port wins over config)
+        # CLI --api-port wins over config
         api_port = self._api_port or self._config.api_port
-        if api_port:
-            self._api = ApiServer(self._config, self._store, self._db, self._weather, api_port)
-            await self._api.start()
 
         # Start remote poller if remote_sites, peers, or api_port configured
         # (api_port alone enables receiving incoming peer sync requests)
         needs_remote = bool(self._config.remote_sites) or bool(self._config.peers) or bool(api_port)
         if needs_remote:
-            def _build_local_status() -> dict:
-                return build_status_payload(self._config, self._store, self._db, self._weather)
+            from .api import StatusCache, build_status_payload
+            from .remote import RemotePoller
+
+            # One cached payload shared by the API server and outgoing peer syncs
+            local_status = StatusCache(
+                lambda: build_status_payload(self._config, self._store, self._db, self._weather)
+            )
+
+            # Start API server if configured
+            if api_port:
+                from .api import ApiServer
+
+                self._api = ApiServer(
+                    self._config, self._store, self._db, self._weather, api_port,
+                    status_fn=local_status,
+                )
+                startup.append(self._api.start())
 
             self._remote = RemotePoller(
                 remote_sites=self._config.remote_sites,
                 peers=self._config.peers,
                 db=self._db,
-                local_status_fn=_build_local_status,
+                local_status_fn=local_status,
+                session=self._http_session(),
             )
-            await self._remote.start()
+            startup.append(self._remote.start())
 
             # Connect API server to remote poller for incoming sync
             if self._api:
@@ -150,45 +189,56 @@ class HutWatchApp:
         # Determine local mode (--console or --tui skip Telegram)
         _local_mode = self._use_tui or self._console_interval is not None
 
+        bot_cls = None
         if not _local_mode and self._config.telegram and _HAS_TELEGRAM:
-            self._bot = TelegramBot(
+            # find_spec only proves the package exists; a broken install fails here
+            try:
+                from .telegram.bot import TelegramBot as bot_cls
+            except ImportError as e:
+                logger.debug("Importing python-telegram-bot failed: %s", e)
+
+        if bot_cls is not None:
+            self._bot = bot_cls(
                 self._config, self._store, self._db, self._weather,
                 remote=self._remote, alert_manager=self._alert_manager,
             )
         elif _local_mode and self._config.telegram:
             logger.info("Local mode active, skipping Telegram bot")
-        elif self._config.telegram and not _HAS_TELEGRAM:
+        elif self._config.telegram:
             logger.warning(
                 "Telegram configured but python-telegram-bot not installed. "
                 "Install with: pip install hutwatch[telegram]"
             )
 
+        await asyncio.gather(*startup)
+
         # Start aggregator (does not need restart loop)
         await self._aggregator.start()
 
-        # Start scanner with restart loop in background task
-        self._scanner_task = asyncio.create_task(
-            self._scanner.run_with_restart(),
-            name="ble_scanner",
-        )
+        # Start scanner with restart loop in background task. run_with_restart
+        # recycles the BLE scanner itself on every cycle and on errors it catches;
+        # _spawn only restarts it if an exception escapes that loop.
+        self._spawn("_scanner_task", "ble_scanner", self._scanner.run_with_restart)
 
         # Start bot with restart loop in background task
         if self._bot:
-            self._bot_task = asyncio.create_task(
-                self._bot.run_with_restart(),
-                name="telegram_bot",
-            )
-            # Wait briefly for bot to start before sending message
-            await asyncio.sleep(2)
+            self._spawn("_bot_task", "telegram_bot", self._bot.run_with_restart)
+            # Give the bot a moment to connect before continuing
+            if not await self._bot.wait_started(BOT_START_TIMEOUT):
+                logger.warning("Telegram bot not connected yet, continuing startup")
         else:
             # No Telegram — use TUI or console output
             if self._use_tui:
+                from .tui import TuiDashboard
+
                 self._tui = TuiDashboard(
                     self._config, self._store, self._db, self._weather,
                     app=self, remote=self._remote, alert_manager=self._alert_manager,
                 )
                 await self._tui.start()
             else:
+                from .console import ConsoleReporter
+
                 interval = self._console_interval if self._console_interval is not None else 30
                 self._console = ConsoleReporter(
                     self._config, self._store, self._db, interval=interval,
@@ -215,53 +265,54 @@ class HutWatchApp:
                 pass
 
         # Cancel background tasks
-        if self._bot_task:
-            self._bot_task.cancel()
-            try:
-                await self._bot_task
-            except asyncio.CancelledError:
-                pass
-            self._bot_task = None
-
-        if self._scanner_task:
-            self._scanner_task.cancel()
-            try:
-                await self._scanner_task
-            except asyncio.CancelledError:
-                pass
-            self._scanner_task = None
+        tasks = [task for task in (self._bot_task, self._scanner_task) if task]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=TASK_CANCEL_TIMEOUT)
+            for task in pending:
+                logger.warning("Task %s did not stop within %.0fs", task.get_name(), TASK_CANCEL_TIMEOUT)
+        self._bot_task = None
+        self._scanner_task = None
 
         # Stop remote poller and API server first
-        if self._remote:
-            await self._remote.stop()
-
-        if self._api:
-            await self._api.stop()
-
-        # Stop components in reverse order
-        if self._tui:
-            await self._tui.stop()
+        await self._stop_all(self._remote, self._api)
 
-        if self._console:
-            await self._console.stop()
-
-        if self._bot:
-            await self._bot.stop()
-
-        if self._aggregator:
-            await self._aggregator.stop()
-
-        if self._scanner:
-            await self._scanner.stop()
+        # Stop remaining components concurrently
+        await self._stop_all(
+            self._tui, self._console, self._bot,
+            self._aggregator, self._scanner, self._weather,
+        )
 
-        if self._weather:
-            await self._weather.stop()
+        if self._http:
+            await self._http.close()
+            self._http = None
 
         if self._db:
             self._db.close()
 
         logger.info("HutWatch stopped")
 
+    def _http_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP client session shared by weather and remote polling."""
+        if self._http is None:
+            import aiohttp
+
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+            )
+        return self._http
+
+    async def _stop_all(self, *components: object) -> None:
+        """Stop components concurrently, logging any failures."""
+        running = [c for c in components if c]
+        results = await asyncio.gather(
+            *(c.stop() for c in running), return_exceptions=True,
+        )
+        for component, result in zip(running, results):
+            if isinstance(result, Exception):
+                logger.error("Error stopping %s: %s", type(component).__name__, result)
+
     async def setup_weather(self, lat: float, lon: float, name: str = "") -> None:
         """Set up weather fetching dynamically (e.g. from TUI)."""
         if not name:
@@ -269,7 +320,9 @@ class HutWatchApp:
         weather_config = WeatherConfig(latitude=lat, longitude=lon, location_name=name)
         self._config.weather = weather_config
 
-        self._weather = WeatherFetcher(weather_config)
+        from .weather import WeatherFetcher
+
+        self._weather = WeatherFetcher(weather_config, db=self._db, session=self._http_session())
         await self._weather.start()
 
         # Tell aggregator to start periodic weather fetching
@@ -286,17 +339,25 @@ class HutWatchApp:
 
         # Persist to database for next startup
         if self._db:
-            self._db.set_setting("weather_lat", str(lat))
-            self._db.set_setting("weather_lon", str(lon))
-            self._db.set_setting("weather_name", name)
+            self._db.set_settings({
+                "weather_lat": str(lat),
+                "weather_lon": str(lon),
+                "weather_name": name,
+            })
 
         logger.info("Weather configured for %s (%.4f, %.4f)", name, lat, lon)
 
     async def refresh_weather(self) -> bool:
-        """Fetch weather on demand. Returns True if successful."""
-        if self._aggregator:
-            return await self._aggregator.fetch_weather_now()
-        return False
+        """Fetch weather on demand. Returns True if successful.
+
+        Concurrent calls share one in-flight fetch.
+        """
+        if not self._aggregator:
+            return False
+        if self._weather_refresh is None or self._weather_refresh.done():
+            self._weather_refresh = asyncio.create_task(self._aggregator.fetch_weather_now())
+        # Shield so one cancelled caller doesn't abort the fetch for the others
+        return await asyncio.shield(self._weather_refresh)
 
     async def _emit_alerts(self, events: list) -> None:
         """Route alert events to the active UI."""
@@ -339,43 +400,69 @@ class HutWatchApp:
         loop = asyncio.get_running_loop()
 
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(
-                sig,
-                lambda: asyncio.create_task(self._handle_shutdown()),
-            )
+            loop.add_signal_handler(sig, self._handle_shutdown)
 
         try:
             await self.start()
-
-            # Wait for shutdown while monitoring background tasks
-            while not self._shutdown_event.is_set():
-                # Check background tasks for unexpected failures
-                await self._monitor_tasks()
-                await asyncio.sleep(5)
-
+            await self._shutdown_event.wait()
         finally:
             await self.stop()
 
-    async def _monitor_tasks(self) -> None:
-        """Monitor background tasks and log any failures."""
-        if self._scanner_task and self._scanner_task.done():
-            try:
-                # Get exception if any
-                exc = self._scanner_task.exception()
-                if exc:
-                    logger.error("BLE scanner task failed: %s", exc)
-            except asyncio.CancelledError:
-                pass
+    def _spawn(
+        self,
+        attr: str,
+        name: str,
+        factory: Callable[[], Awaitable[None]],
+        delay: float = 0,
+        failures: int = 0,
+    ) -> None:
+        """Run a background task stored on attr, restarting it if it fails.
+
+        This is the outer supervisor: tasks such as run_with_restart keep their
+        own restart loops, and this only catches failures those loops let through.
+        """
+        coro = self._restart_after(delay, factory) if delay else factory()
+        task = asyncio.create_task(coro, name=name)
+        # When factory() actually starts, after the restart delay
+        started = time.monotonic() + delay
+        task.add_done_callback(
+            functools.partial(self._on_task_done, attr, factory, failures, started)
+        )
+        setattr(self, attr, task)
 
-        if self._bot_task and self._bot_task.done():
-            try:
-                exc = self._bot_task.exception()
-                if exc:
-                    logger.error("Telegram bot task failed: %s", exc)
-            except asyncio.CancelledError:
-                pass
+    def _on_task_done(
+        self,
+        attr: str,
+        factory: Callable[[], Awaitable[None]],
+        failures: int,
+        started: float,
+        task: asyncio.Task,
+    ) -> None:
+        """Log a failed background task and restart it with exponential backoff."""
+        if task.cancelled() or task.exception() is None:
+            return
+        if self._shutdown_event and self._shutdown_event.is_set():
+            return
 
-    async def _handle_shutdown(self) -> None:
-        """Handle shutdown signal."""
+        # Occasional crashes after long healthy runs start the backoff over
+        if time.monotonic() - started >= TASK_HEALTHY_SECONDS:
+            failures = 0
+        delay = min(TASK_RESTART_MAX_DELAY, 2 ** failures)
+        logger.error(
+            "Task %s failed: %s (restarting in %ds)", task.get_name(), task.exception(), delay,
+        )
+        self._spawn(attr, task.get_name(), factory, delay=delay, failures=failures + 1)
+
+    @staticmethod
+    async def _restart_after(delay: float, factory: Callable[[], Awaitable[None]]) -> None:
+        """Sleep, then run a background task coroutine again."""
+        await asyncio.sleep(delay)
+        await factory()
+
+    def _handle_shutdown(self) -> None:
+        """Handle shutdown signal (called directly by the event loop)."""
+        # Repeated Ctrl-C while stopping is a no-op
+        if self._shutdown_event.is_set():
+            return
         logger.info("Shutdown signal received")
         self._shutdown_event.set()
@@ -1,6 +1,8 @@
 """Base parser class for BLE advertisements."""
 
 from abc import ABC, abstractmethod
+from dataclasses import replace
+from datetime import datetime
 from typing import Optional
 
 from bleak.backends.device import BLEDevice
@@ -8,15 +10,44 @@ from bleak.backends.scanner import AdvertisementData
 
 from ...models import SensorReading
 
+# Max MACs whose last payload is remembered per parser
+LAST_PAYLOAD_CACHE_SIZE = 256
+
 
 class BaseParser(ABC):
     """Abstract base class for BLE advertisement parsers."""
 
+    def __init__(self) -> None:
+        # MAC -> (raw payload, reading parsed from it)
+        self._last: dict[str, tuple[bytes, SensorReading]] = {}
+
+    def _get_repeated(self, mac: str, data: bytes, now: datetime) -> Optional[SensorReading]:
+        """Return a fresh copy of the last reading if the payload is unchanged.
+
+        Sensors retransmit the same frame several times; those repeats skip decoding.
+        """
+        last = self._last.get(mac)
+        if last is None or last[0] != data:
+            return None
+        return replace(last[1], timestamp=now)
+
+    def _remember(self, mac: str, data: bytes, reading: Optional[SensorReading]) -> None:
+        """Remember the payload a reading was parsed from."""
+        if reading is None:
+            return
+        self._last.pop(mac, None)
+        if len(self._last) >= LAST_PAYLOAD_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._last[next(iter(self._last))]
+        self._last[mac] = (bytes(data), reading)
+
     @abstractmethod
     def parse(
         self,
         device: BLEDevice,
         advertisement_data: AdvertisementData,
+        now: Optional[datetime] = None,
+        mac: Optional[str] = None,
     ) -> Optional[SensorReading]:
         """
         Parse BLE advertisement data and return a SensorReading if valid.
@@ -24,6 +55,8 @@ class BaseParser(ABC):
         Args:
             device: BLE device information
             advertisement_data: Advertisement data from the device
+            now: Reading timestamp; defaults to datetime.now()
+            mac: Uppercase MAC for the reading; defaults to device.address.upper()
 
         Returns:
             SensorReading if successfully parsed, None otherwise
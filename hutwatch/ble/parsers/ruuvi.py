@@ -16,6 +16,15 @@ logger = logging.getLogger(__name__)
 # RuuviTag manufacturer ID
 RUUVI_MANUFACTURER_ID = 0x0499
 
+# Data formats this parser decodes
+SUPPORTED_FORMATS = frozenset((3, 5))
+
+# Precompiled payload layouts, unpacked from byte 1 (after the format byte)
+# DF3: humidity, temp int, temp fraction, pressure, accel x/y/z, battery mV
+_DF3 = struct.Struct(">BbBHhhhH")
+# DF5: temp, humidity, pressure, accel x/y/z, power info, movement, sequence
+_DF5 = struct.Struct(">hHHhhhHBH")
+
 
 class RuuviParser(BaseParser):
     """Parser for RuuviTag Data Format 3 (RAWv1) and Data Format 5 (RAWv2)."""
@@ -26,37 +35,41 @@ class RuuviParser(BaseParser):
         advertisement_data: AdvertisementData,
     ) -> bool:
         """Check if this is a RuuviTag advertisement."""
-        if RUUVI_MANUFACTURER_ID not in advertisement_data.manufacturer_data:
-            return False
-
-        data = advertisement_data.manufacturer_data[RUUVI_MANUFACTURER_ID]
-        if len(data) < 1:
-            return False
-
+        data = advertisement_data.manufacturer_data.get(RUUVI_MANUFACTURER_ID)
         # Check for supported data formats
-        data_format = data[0]
-        return data_format in (3, 5)
+        return bool(data) and data[0] in SUPPORTED_FORMATS
 
     def parse(
         self,
         device: BLEDevice,
         advertisement_data: AdvertisementData,
+        now: Optional[datetime] = None,
+        mac: Optional[str] = None,
     ) -> Optional[SensorReading]:
         """Parse RuuviTag advertisement data."""
-        if not self.can_parse(device, advertisement_data):
+        # Single lookup; checks the same conditions as can_parse()
+        data = advertisement_data.manufacturer_data.get(RUUVI_MANUFACTURER_ID)
+        if not data:
             return None
 
-        data = advertisement_data.manufacturer_data[RUUVI_MANUFACTURER_ID]
-        data_format = data[0]
+        if mac is None:
+            mac = device.address.upper()
+        if now is None:
+            now = datetime.now()
+        reading = self._get_repeated(mac, data, now)
+        if reading:
+            return reading
 
+        data_format = data[0]
         if data_format == 3:
-            return self._parse_df3(device.address, data)
+            reading = self._parse_df3(mac, data, now)
         elif data_format == 5:
-            return self._parse_df5(device.address, data)
+            reading = self._parse_df5(mac, data, now)
 
-        return None
+        self._remember(mac, data, reading)
+        return reading
 
-    def _parse_df3(self, mac: str, data: bytes) -> Optional[SensorReading]:
+    def _parse_df3(self, mac: str, data: bytes, now: datetime) -> Optional[SensorReading]:
         """
         Parse Data Format 3 (RAWv1).
 
@@ -75,38 +88,33 @@ class RuuviParser(BaseParser):
             logger.warning("DF3 data too short: %d bytes", len(data))
             return None
 
-        try:
-            humidity = data[1] * 0.5
+        (
+            humidity_raw, temp_int, temp_frac_raw, pressure_raw,
+            _accel_x, _accel_y, _accel_z, battery_mv,
+        ) = _DF3.unpack_from(data, 1)
 
-            # Temperature: signed integer + fraction
-            temp_int = data[2]
-            if temp_int > 127:
-                temp_int -= 256
-            temp_frac = data[3] / 100.0
-            temperature = temp_int + (temp_frac if temp_int >= 0 else -temp_frac)
+        humidity = humidity_raw * 0.5
 
-            # Pressure in Pa, add 50000 and convert to hPa
-            pressure_raw = struct.unpack(">H", data[4:6])[0]
-            pressure = (pressure_raw + 50000) / 100.0
+        # Temperature: signed integer + fraction
+        temp_frac = temp_frac_raw / 100.0
+        temperature = temp_int + (temp_frac if temp_int >= 0 else -temp_frac)
 
-            # Battery voltage in mV
-            battery_mv = struct.unpack(">H", data[12:14])[0]
-            battery_voltage = battery_mv / 1000.0
-
-            return SensorReading(
-                mac=mac,
-                timestamp=datetime.now(),
-                temperature=temperature,
-                humidity=humidity,
-                pressure=pressure,
-                battery_voltage=battery_voltage,
-            )
-
-        except Exception as e:
-            logger.warning("Error parsing DF3: %s", e)
-            return None
+        # Pressure in Pa, add 50000 and convert to hPa
+        pressure = (pressure_raw + 50000) / 100.0
 
-    def _parse_df5(self, mac: str, data: bytes) -> Optional[SensorReading]:
+        # Battery voltage in mV
+        battery_voltage = battery_mv / 1000.0
+
+        return SensorReading(
+            mac=mac,
+            timestamp=now,
+            temperature=temperature,
+            humidity=humidity,
+            pressure=pressure,
+            battery_voltage=battery_voltage,
+        )
+
+    def _parse_df5(self, mac: str, data: bytes, now: datetime) -> Optional[SensorReading]:
         """
         Parse Data Format 5 (RAWv2).
 
@@ -126,48 +134,44 @@ class RuuviParser(BaseParser):
             logger.warning("DF5 data too short: %d bytes", len(data))
             return None
 
-        try:
-            # Temperature: signed 16-bit, 0.005°C per unit
-            temp_raw = struct.unpack(">h", data[1:3])[0]
-            temperature = temp_raw * 0.005
-
-            # Check for invalid temperature
-            if temp_raw == -32768:
-                logger.debug("DF5: Invalid temperature value")
-                return None
-
-            # Humidity: unsigned 16-bit, 0.0025% per unit
-            humidity_raw = struct.unpack(">H", data[3:5])[0]
-            humidity = humidity_raw * 0.0025
-
-            # Check for invalid humidity
-            if humidity_raw == 65535:
-                humidity = None
-
-            # Pressure: unsigned 16-bit, add 50000 Pa, convert to hPa
-            pressure_raw = struct.unpack(">H", data[5:7])[0]
-            if pressure_raw == 65535:
-                pressure = None
-            else:
-                pressure = (pressure_raw + 50000) / 100.0
-
-            # Power info: 11 bits voltage + 5 bits TX power
-            power_raw = struct.unpack(">H", data[13:15])[0]
-            voltage_raw = power_raw >> 5
-            if voltage_raw == 2047:
-                battery_voltage = None
-            else:
-                battery_voltage = (voltage_raw + 1600) / 1000.0
-
-            return SensorReading(
-                mac=mac,
-                timestamp=datetime.now(),
-                temperature=temperature,
-                humidity=humidity,
-                pressure=pressure,
-                battery_voltage=battery_voltage,
-            )
-
-        except Exception as e:
-            logger.warning("Error parsing DF5: %s", e)
+        (
+            temp_raw, humidity_raw, pressure_raw,
+            _accel_x, _accel_y, _accel_z, power_raw, _movement, _sequence,
+        ) = _DF5.unpack_from(data, 1)
+
+        # Temperature: signed 16-bit, 0.005°C per unit
+        temperature = temp_raw * 0.005
+
+        # Check for invalid temperature
+        if temp_raw == -32768:
+            logger.debug("DF5: Invalid temperature value")
             return None
+
+        # Humidity: unsigned 16-bit, 0.0025% per unit
+        humidity = humidity_raw * 0.0025
+
+        # Check for invalid humidity
+        if humidity_raw == 65535:
+            humidity = None
+
+        # Pressure: unsigned 16-bit, add 50000 Pa, convert to hPa
+        if pressure_raw == 65535:
+            pressure = None
+        else:
+            pressure = (pressure_raw + 50000) / 100.0
+
+        # Power info: 11 bits voltage + 5 bits TX power
+        voltage_raw = power_raw >> 5
+        if voltage_raw == 2047:
+            battery_voltage = None
+        else:
+            battery_voltage = (voltage_raw + 1600) / 1000.0
+
+        return SensorReading(
+            mac=mac,
+            timestamp=now,
+            temperature=temperature,
+            humidity=humidity,
+            pressure=pressure,
+            battery_voltage=battery_voltage,
+        )
@@ -19,45 +19,68 @@ ATC_SERVICE_UUID = "0000181a-0000-1000-8000-00805f9b34fb"
 # PVVX firmware can also use a custom UUID
 PVVX_SERVICE_UUID = "0000181a-0000-1000-8000-00805f9b34fb"
 
+# Precompiled payload layouts, unpacked from byte 6 (after the MAC address)
+# ATC: temp, humidity %, battery %, battery mV, counter (big-endian)
+_ATC = struct.Struct(">hBBHB")
+# PVVX: temp, humidity, battery mV, battery %, counter, flags (little-endian)
+_PVVX = struct.Struct("<hHHBBB")
+
 
 class XiaomiParser(BaseParser):
     """Parser for Xiaomi LYWSD03MMC with ATC or PVVX custom firmware."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Payload length -> decoder: ATC is 13 bytes, PVVX is 15-17 bytes
+        self._by_length = {
+            13: self._parse_atc,
+            15: self._parse_pvvx,
+            16: self._parse_pvvx,
+            17: self._parse_pvvx,
+        }
+
     def can_parse(
         self,
         device: BLEDevice,
         advertisement_data: AdvertisementData,
     ) -> bool:
         """Check if this is a Xiaomi sensor with custom firmware."""
-        service_data = advertisement_data.service_data
-
         # Check for ATC/PVVX service UUID
-        if ATC_SERVICE_UUID in service_data:
-            data = service_data[ATC_SERVICE_UUID]
-            # ATC format is 13 bytes, PVVX format is 15-17 bytes
-            return len(data) in (13, 15, 16, 17)
+        data = advertisement_data.service_data.get(ATC_SERVICE_UUID)
+        if data is None:
+            return False
 
-        return False
+        return len(data) in self._by_length
 
     def parse(
         self,
         device: BLEDevice,
         advertisement_data: AdvertisementData,
+        now: Optional[datetime] = None,
+        mac: Optional[str] = None,
     ) -> Optional[SensorReading]:
         """Parse Xiaomi sensor advertisement data."""
-        if not self.can_parse(device, advertisement_data):
+        # Single lookup; checks the same conditions as can_parse()
+        data = advertisement_data.service_data.get(ATC_SERVICE_UUID)
+        if data is None:
             return None
 
-        data = advertisement_data.service_data[ATC_SERVICE_UUID]
+        if mac is None:
+            mac = device.address.upper()
+        if now is None:
+            now = datetime.now()
+        reading = self._get_repeated(mac, data, now)
+        if reading:
+            return reading
 
-        if len(data) == 13:
-            return self._parse_atc(device.address, data)
-        elif len(data) >= 15:
-            return self._parse_pvvx(device.address, data)
+        decode = self._by_length.get(len(data))
+        if decode:
+            reading = decode(mac, data, now)
 
-        return None
+        self._remember(mac, data, reading)
+        return reading
 
-    def _parse_atc(self, mac: str, data: bytes) -> Optional[SensorReading]:
+    def _parse_atc(self, mac: str, data: bytes, now: datetime) -> Optional[SensorReading]:
         """
         Parse ATC firmware format (13 bytes).
 
@@ -73,35 +96,27 @@ class XiaomiParser(BaseParser):
             logger.warning("ATC data too short: %d bytes", len(data))
             return None
 
-        try:
-            # Temperature: signed 16-bit big-endian, 0.01°C per unit
-            temp_raw = struct.unpack(">h", data[6:8])[0]
-            temperature = temp_raw / 10.0
+        temp_raw, humidity_raw, battery_percent, battery_mv, _counter = _ATC.unpack_from(data, 6)
 
-            # Humidity: single byte percentage
-            humidity = float(data[8])
+        # Temperature: signed 16-bit big-endian, 0.01°C per unit
+        temperature = temp_raw / 10.0
 
-            # Battery percentage
-            battery_percent = data[9]
+        # Humidity: single byte percentage
+        humidity = float(humidity_raw)
 
-            # Battery voltage in mV
-            battery_mv = struct.unpack(">H", data[10:12])[0]
-            battery_voltage = battery_mv / 1000.0
+        # Battery voltage in mV
+        battery_voltage = battery_mv / 1000.0
 
-            return SensorReading(
-                mac=mac,
-                timestamp=datetime.now(),
-                temperature=temperature,
-                humidity=humidity,
-                battery_voltage=battery_voltage,
-                battery_percent=battery_percent,
-            )
-
-        except Exception as e:
-            logger.warning("Error parsing ATC format: %s", e)
-            return None
+        return SensorReading(
+            mac=mac,
+            timestamp=now,
+            temperature=temperature,
+            humidity=humidity,
+            battery_voltage=battery_voltage,
+            battery_percent=battery_percent,
+        )
 
-    def _parse_pvvx(self, mac: str, data: bytes) -> Optional[SensorReading]:
+    def _parse_pvvx(self, mac: str, data: bytes, now: datetime) -> Optional[SensorReading]:
         """
         Parse PVVX firmware format (15-17 bytes).
 
@@ -119,31 +134,24 @@ class XiaomiParser(BaseParser):
             logger.warning("PVVX data too short: %d bytes", len(data))
             return None
 
-        try:
-            # Temperature: signed 16-bit little-endian, 0.01°C per unit
-            temp_raw = struct.unpack("<h", data[6:8])[0]
-            temperature = temp_raw / 100.0
-
-            # Humidity: unsigned 16-bit little-endian, 0.01% per unit
-            humidity_raw = struct.unpack("<H", data[8:10])[0]
-            humidity = humidity_raw / 100.0
-
-            # Battery voltage in mV
-            battery_mv = struct.unpack("<H", data[10:12])[0]
-            battery_voltage = battery_mv / 1000.0
-
-            # Battery percentage
-            battery_percent = data[12]
-
-            return SensorReading(
-                mac=mac,
-                timestamp=datetime.now(),
-                temperature=temperature,
-                humidity=humidity,
-                battery_voltage=battery_voltage,
-                battery_percent=battery_percent,
-            )
-
-        except Exception as e:
-            logger.warning("Error parsing PVVX format: %s", e)
-            return None
+        (
+            temp_raw, humidity_raw, battery_mv, battery_percent, _counter, _flags,
+        ) = _PVVX.unpack_from(data, 6)
+
+        # Temperature: signed 16-bit little-endian, 0.01°C per unit
+        temperature = temp_raw / 100.0
+
+        # Humidity: unsigned 16-bit little-endian, 0.01% per unit
+        humidity = humidity_raw / 100.0
+
+        # Battery voltage in mV
+        battery_voltage = battery_mv / 1000.0
+
+        return SensorReading(
+            mac=mac,
+            timestamp=now,
+            temperature=temperature,
+            humidity=humidity,
+            battery_voltage=battery_voltage,
+            battery_percent=battery_percent,
+        )
@@ -3,24 +3,43 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import subprocess
 import sys
+import time
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 from bleak import BleakScanner as BleakScannerLib
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 
-from ..models import AppConfig, SensorReading, SensorType
-from .parsers import RuuviParser, XiaomiParser
+try:
+    from dbus_fast import BusType, Variant
+    from dbus_fast.aio import MessageBus
+except ImportError:  # Installed by Bleak only for its BlueZ backend
+    MessageBus = None  # type: ignore[assignment,misc]
+
+from ..models import AppConfig, SensorConfig, SensorReading, SensorType
+from .parsers import BaseParser, RuuviParser, XiaomiParser
+from .parsers.ruuvi import RUUVI_MANUFACTURER_ID
+from .parsers.xiaomi import ATC_SERVICE_UUID
 from .sensor_store import SensorStore
 
 logger = logging.getLogger(__name__)
 
 IS_MACOS = sys.platform == "darwin"
 
+# BlueZ object path of the adapter reset on recovery
+BLUEZ_ADAPTER_PATH = "/org/bluez/hci0"
+
+
+@functools.lru_cache(maxsize=1024)
+def _upper_mac(address: str) -> str:
+    """Uppercase and intern a raw address; nearby devices advertise it repeatedly."""
+    return sys.intern(address.upper())
+
 
 class BleScanner:
     """BLE scanner that detects and parses sensor advertisements.
@@ -38,6 +57,15 @@ class BleScanner:
     # Timeout for stop() operation - don't let it hang forever
     STOP_TIMEOUT_SECONDS = 10
 
+    # Unknown MACs matching no parser this many times are ignored until the next restart
+    DISCOVERY_REJECT_THRESHOLD = 3
+
+    # Most rejected MACs tracked at once; the oldest entry is evicted beyond this
+    MAX_REJECTED_MACS = 4096
+
+    # Discoveries within this many seconds are written to the database together
+    DEVICE_SYNC_DELAY_SECONDS = 1.0
+
     def __init__(
         self,
         config: AppConfig,
@@ -51,7 +79,15 @@ class BleScanner:
         self._on_reading = on_reading
         self._scanner: Optional[BleakScannerLib] = None
         self._running = False
-        self._last_data_time: Optional[datetime] = None
+        # time.monotonic() of the last stored reading, for the watchdog
+        self._last_data_time: Optional[float] = None
+        self._device_sync_handle: Optional[asyncio.TimerHandle] = None
+        # Set by the watchdog or stop() to end the current scan cycle
+        self._restart_event = asyncio.Event()
+        self._restart_reason = ""
+        self._watchdog: Optional[asyncio.TimerHandle] = None
+        # Per-reading debug logging is skipped unless enabled; refreshed every scan cycle
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
         # Initialize parsers
         self._ruuvi_parser = RuuviParser()
@@ -60,14 +96,21 @@ class BleScanner:
             (self._ruuvi_parser, SensorType.RUUVI),
             (self._xiaomi_parser, SensorType.XIAOMI),
         ]
-
-        # Track configured MACs for filtering
-        self._configured_macs = config.get_sensor_macs()
-        self._discovered_macs: set[str] = set()
+        # Discovery looks up candidate parsers by the advert's manufacturer ID or service UUID
+        self._parser_by_company = {RUUVI_MANUFACTURER_ID: (self._ruuvi_parser, SensorType.RUUVI)}
+        self._parser_by_service = {ATC_SERVICE_UUID: (self._xiaomi_parser, SensorType.XIAOMI)}
+
+        # Bound parse method and name per uppercase MAC, updated as sensors are discovered
+        self._parse_fn: dict[str, Callable[..., Optional[SensorReading]]] = {}
+        self._sensor_name: dict[str, str] = {}
+        for sensor_config in config.sensors:
+            self._register(sensor_config)
+        # Unknown MAC -> adverts that matched no parser, cleared every scanner cycle
+        self._rejected_macs: dict[str, int] = {}
 
         logger.info(
             "BLE Scanner initialized with %d configured sensors (discovery always on)",
-            len(self._configured_macs),
+            len(self._parse_fn),
         )
 
     def _detection_callback(
@@ -75,56 +118,74 @@ class BleScanner:
         device: BLEDevice,
         advertisement_data: AdvertisementData,
     ) -> None:
-        """Handle detected BLE advertisement.
+        """Handle a detected BLE advertisement.
+
+        Bleak calls this on the event loop thread, so adverts are parsed and
+        stored inline without a queue or worker task.
+        """
+        # Drop phones, headphones etc. before parsing: every parser needs one of these
+        if (
+            RUUVI_MANUFACTURER_ID not in advertisement_data.manufacturer_data
+            and ATC_SERVICE_UUID not in advertisement_data.service_data
+        ):
+            return
+
+        reading = self._handle_advertisement(device, advertisement_data, datetime.now())
+        if not reading:
+            return
+
+        try:
+            self._store.add_reading(reading)
+            self._last_data_time = time.monotonic()
+
+            if self._on_reading:
+                self._on_reading(reading)
+        except Exception as e:
+            logger.warning("Error storing reading: %s", e)
+
+    def _handle_advertisement(
+        self,
+        device: BLEDevice,
+        advertisement_data: AdvertisementData,
+        now: datetime,
+    ) -> Optional[SensorReading]:
+        """Parse one advertisement into a reading.
 
         Known MACs are parsed with their configured sensor type.
         Unknown MACs are tried against all parsers for auto-discovery.
         """
-        mac = device.address.upper()
+        mac = _upper_mac(device.address)
 
         try:
             # Fast path: known sensor with configured type
-            sensor_config = self._config.get_sensor_by_mac(mac)
-            if sensor_config:
-                reading: Optional[SensorReading] = None
-
-                if sensor_config.type == SensorType.RUUVI:
-                    reading = self._ruuvi_parser.parse(device, advertisement_data)
-                elif sensor_config.type == SensorType.XIAOMI:
-                    reading = self._xiaomi_parser.parse(device, advertisement_data)
-
+            parse = self._parse_fn.get(mac)
+            if parse:
+                reading = parse(device, advertisement_data, now, mac)
                 if reading:
                     reading.rssi = advertisement_data.rssi
-                    self._store.add_reading(reading)
-                    self._last_data_time = datetime.now()
-
-                    if self._on_reading:
-                        self._on_reading(reading)
-
-                    logger.debug(
-                        "Received reading from %s (%s): %.1f°C",
-                        sensor_config.name,
-                        mac,
-                        reading.temperature,
-                    )
-                return
+                    if self._debug:
+                        logger.debug(
+                            "Received reading from %s (%s): %.1f°C",
+                            self._sensor_name[mac],
+                            mac,
+                            reading.temperature,
+                        )
+                return reading
 
             # Discovery: try each parser for unknown MACs
-            if mac in self._discovered_macs:
-                return  # Already registered via discovery
+            rejected = self._rejected_macs.get(mac, 0)
+            if rejected >= self.DISCOVERY_REJECT_THRESHOLD:
+                return None  # Not a supported sensor
 
-            for parser, sensor_type in self._parsers:
+            for parser, sensor_type in self._discovery_candidates(advertisement_data):
                 if not parser.can_parse(device, advertisement_data):
                     continue
 
                 # Auto-register new sensor
-                self._discovered_macs.add(mac)
                 name = f"{sensor_type.value}_{mac.replace(':', '')[-6:]}"
-                self._config.add_sensor(mac, name, sensor_type)
-                self._configured_macs = self._config.get_sensor_macs()
+                self._register(self._config.add_sensor(mac, name, sensor_type))
 
-                if self._db:
-                    self._db.sync_devices_from_config(self._config.sensors)
+                self._schedule_device_sync()
 
                 logger.info(
                     "Discovered %s sensor: %s (%s)",
@@ -133,26 +194,72 @@ class BleScanner:
                     mac,
                 )
 
-                reading = parser.parse(device, advertisement_data)
+                reading = parser.parse(device, advertisement_data, now, mac)
                 if reading:
                     reading.rssi = advertisement_data.rssi
-                    self._store.add_reading(reading)
-                    self._last_data_time = datetime.now()
-
-                    if self._on_reading:
-                        self._on_reading(reading)
-
                     logger.debug(
                         "Received reading from %s (%s): %.1f°C",
                         name,
                         mac,
                         reading.temperature,
                     )
-                break
+                return reading
+
+            if not rejected and len(self._rejected_macs) >= self.MAX_REJECTED_MACS:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._rejected_macs[next(iter(self._rejected_macs))]
+            self._rejected_macs[mac] = rejected + 1
 
         except Exception as e:
             logger.warning("Error parsing data from %s: %s", mac, e)
 
+        return None
+
+    def _discovery_candidates(
+        self,
+        advertisement_data: AdvertisementData,
+    ) -> Iterator[tuple[BaseParser, SensorType]]:
+        """Yield the parsers claiming this advert's manufacturer IDs or service UUIDs."""
+        for company_id in advertisement_data.manufacturer_data:
+            candidate = self._parser_by_company.get(company_id)
+            if candidate:
+                yield candidate
+        for uuid in advertisement_data.service_data:
+            candidate = self._parser_by_service.get(uuid)
+            if candidate:
+                yield candidate
+
+    def _register(self, sensor_config: SensorConfig) -> None:
+        """Map a sensor's MAC to its parser's bound parse method."""
+        for parser, sensor_type in self._parsers:
+            if sensor_type == sensor_config.type:
+                mac = sensor_config.mac  # Uppercased and interned by SensorConfig
+                self._parse_fn[mac] = parser.parse
+                self._sensor_name[mac] = sensor_config.name
+                return
+
+    def _schedule_device_sync(self) -> None:
+        """Write discovered sensors to the database after DEVICE_SYNC_DELAY_SECONDS."""
+        if self._db is None or self._device_sync_handle is not None:
+            return
+        self._device_sync_handle = asyncio.get_running_loop().call_later(
+            self.DEVICE_SYNC_DELAY_SECONDS, self._sync_devices,
+        )
+
+    def _sync_devices(self) -> None:
+        """Sync configured sensors to the database."""
+        self._device_sync_handle = None
+        try:
+            self._db.sync_devices_from_config(self._config.sensors)
+        except Exception as e:
+            logger.warning("Error syncing discovered sensors: %s", e)
+
+    def _flush_device_sync(self) -> None:
+        """Run a pending device sync now, before the database can be closed."""
+        if self._device_sync_handle is not None:
+            self._device_sync_handle.cancel()
+            self._sync_devices()
+
     async def _create_scanner(self) -> BleakScannerLib:
         """Create a fresh scanner instance."""
         return BleakScannerLib(
@@ -179,15 +286,20 @@ class BleScanner:
     async def _reset_bluetooth_adapter(self) -> None:
         """Reset Bluetooth adapter to recover from stuck state.
 
-        Uses bluetoothctl (D-Bus) which works without sudo when user
-        is in bluetooth group, or hciconfig with CAP_NET_ADMIN.
+        Toggles the adapter's Powered property over D-Bus, which works
+        without sudo when user is in bluetooth group. Falls back to the
+        bluetoothctl and hciconfig (CAP_NET_ADMIN) command line tools.
         Skipped on macOS where Core Bluetooth manages the adapter.
         """
         if IS_MACOS:
             logger.debug("Skipping adapter reset on macOS")
             return
 
-        # Try bluetoothctl first (works via D-Bus, no sudo needed)
+        if await self._dbus_power_cycle():
+            logger.info("Bluetooth adapter power cycled via D-Bus")
+            return
+
+        # Try bluetoothctl next (works via D-Bus, no sudo needed)
         try:
             # Power off
             subprocess.run(
@@ -227,6 +339,32 @@ class BleScanner:
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
             logger.debug("hciconfig failed: %s", e)
 
+    async def _dbus_power_cycle(self) -> bool:
+        """Power the adapter off and on through BlueZ. Returns True on success."""
+        if MessageBus is None:
+            return False
+
+        bus = None
+        try:
+            bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+            introspection = await bus.introspect("org.bluez", BLUEZ_ADAPTER_PATH)
+            adapter = bus.get_proxy_object("org.bluez", BLUEZ_ADAPTER_PATH, introspection)
+            props = adapter.get_interface("org.freedesktop.DBus.Properties")
+
+            await props.call_set("org.bluez.Adapter1", "Powered", Variant("b", False))
+            # Wait for adapter to power off
+            await asyncio.sleep(0.5)
+            await props.call_set("org.bluez.Adapter1", "Powered", Variant("b", True))
+            # Wait for adapter to fully power on
+            await asyncio.sleep(1)
+            return True
+        except Exception as e:
+            logger.debug("D-Bus power cycle failed: %s", e)
+            return False
+        finally:
+            if bus:
+                bus.disconnect()
+
     @property
     def is_running(self) -> bool:
         """Check if scanner is running."""
@@ -240,9 +378,10 @@ class BleScanner:
 
         logger.info("Starting BLE scanner...")
         self._running = True
+        self._debug = logger.isEnabledFor(logging.DEBUG)
         self._scanner = await self._create_scanner()
         await self._scanner.start()
-        self._last_data_time = datetime.now()
+        self._last_data_time = time.monotonic()
         logger.info("BLE scanner started")
 
     async def stop(self) -> None:
@@ -252,23 +391,34 @@ class BleScanner:
 
         logger.info("Stopping BLE scanner...")
         self._running = False
+        self._restart_event.set()  # Wake run_with_restart
         await self._stop_scanner_safe()
+        self._flush_device_sync()
         logger.info("BLE scanner stopped")
 
-    def _should_restart(self) -> tuple[bool, str]:
-        """Check if scanner should be restarted.
+    def _arm_watchdog(self, delay: float) -> None:
+        """Schedule a watchdog check delay seconds from now."""
+        self._watchdog = asyncio.get_running_loop().call_later(delay, self._check_watchdog)
 
-        Returns (should_restart, reason).
-        """
-        now = datetime.now()
+    def _disarm_watchdog(self) -> None:
+        """Cancel a pending watchdog check."""
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            self._watchdog = None
 
-        # Check watchdog - no data received
-        if self._last_data_time:
-            elapsed = (now - self._last_data_time).total_seconds()
-            if elapsed > self.WATCHDOG_TIMEOUT_SECONDS:
-                return True, f"no data for {elapsed:.0f}s"
+    def _check_watchdog(self) -> None:
+        """Trigger a restart if no data was received within WATCHDOG_TIMEOUT_SECONDS.
 
-        return False, ""
+        Otherwise re-arms itself for when the timeout would next expire, so
+        incoming readings never have to touch the timer.
+        """
+        elapsed = time.monotonic() - self._last_data_time
+        if elapsed >= self.WATCHDOG_TIMEOUT_SECONDS:
+            self._watchdog = None
+            self._restart_reason = f"no data for {elapsed:.0f}s"
+            self._restart_event.set()
+        else:
+            self._arm_watchdog(self.WATCHDOG_TIMEOUT_SECONDS - elapsed)
 
     async def run_with_restart(self) -> None:
         """Run scanner with periodic restarts.
@@ -290,41 +440,43 @@ class BleScanner:
                 if restart_count > 1:
                     await self._reset_bluetooth_adapter()
 
+                # Give rejected MACs another chance and bound the dict's size
+                self._rejected_macs.clear()
+                self._debug = logger.isEnabledFor(logging.DEBUG)
+
                 # Create fresh scanner instance
                 self._scanner = await self._create_scanner()
                 await self._scanner.start()
-                self._last_data_time = datetime.now()
+                self._last_data_time = time.monotonic()
                 self._running = True
 
                 logger.info("BLE scanner running (cycle %d)", restart_count)
 
-                # Run until restart interval or watchdog triggers
-                cycle_start = datetime.now()
-                check_interval = 10  # Check every 10 seconds
-
-                while self._running:
-                    await asyncio.sleep(check_interval)
-
-                    # Check proactive restart interval
-                    cycle_elapsed = (datetime.now() - cycle_start).total_seconds()
-                    if cycle_elapsed >= self.RESTART_INTERVAL_SECONDS:
-                        logger.info(
-                            "Proactive restart after %.0fs",
-                            cycle_elapsed,
-                        )
-                        break
-
-                    # Check watchdog
-                    should_restart, reason = self._should_restart()
-                    if should_restart:
-                        logger.warning("Watchdog restart: %s", reason)
-                        break
+                # Run until restart interval, watchdog or stop()
+                self._restart_event.clear()
+                self._arm_watchdog(self.WATCHDOG_TIMEOUT_SECONDS)
+                try:
+                    await asyncio.wait_for(
+                        self._restart_event.wait(),
+                        timeout=self.RESTART_INTERVAL_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    logger.info(
+                        "Proactive restart after %ds",
+                        self.RESTART_INTERVAL_SECONDS,
+                    )
+                else:
+                    if self._running:
+                        logger.warning("Watchdog restart: %s", self._restart_reason)
+                finally:
+                    self._disarm_watchdog()
 
                 # Stop current scanner
                 await self._stop_scanner_safe()
 
                 # If we're shutting down, exit
                 if not self._running:
+                    self._flush_device_sync()
                     logger.info("BLE scanner stopped")
                     return
 
@@ -334,6 +486,7 @@ class BleScanner:
             except asyncio.CancelledError:
                 logger.info("BLE scanner cancelled")
                 await self._stop_scanner_safe()
+                self._flush_device_sync()
                 return
 
             except Exception as e:
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import logging
+import time
 from collections import deque
+from itertools import islice
 from datetime import datetime, timedelta
 from threading import Lock
-from typing import Optional
+from typing import Iterable, Optional
 
 from ..models import SensorReading
 
@@ -16,56 +20,114 @@ logger = logging.getLogger(__name__)
 HISTORY_DURATION = timedelta(hours=24)
 # Maximum readings per sensor (assuming ~1 reading per minute = 1440 per day)
 MAX_READINGS_PER_SENSOR = 2000
+# Seconds between expiry sweeps per sensor; deque maxlen bounds memory in between
+CLEANUP_INTERVAL_SECONDS = 30
 
 
 class SensorStore:
-    """Thread-safe storage for sensor readings."""
+    """Thread-safe storage for sensor readings, locked per sensor."""
 
     def __init__(self) -> None:
+        # Latest reading per MAC; single dict operations are atomic, so reads take no lock
         self._latest: dict[str, SensorReading] = {}
         self._history: dict[str, deque[SensorReading]] = {}
+        # POSIX timestamps parallel to _history, so range lookups compare floats
+        self._times: dict[str, deque[float]] = {}
+        # Per-MAC locks guarding _history/_times, so sensors don't contend with each other
+        self._locks: dict[str, Lock] = {}
+        # POSIX time of the last expiry sweep per MAC
+        self._last_cleanup: dict[str, float] = {}
+        # Only taken when creating a new MAC's shard
         self._lock = Lock()
+        # Set once the first reading arrives, on the loop of whoever waits for it
+        self._data_available = asyncio.Event()
+        self._waiter_loop: Optional[asyncio.AbstractEventLoop] = None
 
-    def add_reading(self, reading: SensorReading) -> None:
-        """Add a new sensor reading."""
-        mac = reading.mac.upper()
-
+    def _add_shard(self, mac: str) -> Lock:
+        """Create history storage and a lock for a new MAC."""
         with self._lock:
-            self._latest[mac] = reading
-
-            if mac not in self._history:
+            lock = self._locks.get(mac)
+            if lock is None:
                 self._history[mac] = deque(maxlen=MAX_READINGS_PER_SENSOR)
+                self._times[mac] = deque(maxlen=MAX_READINGS_PER_SENSOR)
+                # Published last: a MAC with a lock always has its deques
+                lock = self._locks[mac] = Lock()
+            return lock
 
-            self._history[mac].append(reading)
-            self._cleanup_old_readings(mac)
-
-        logger.debug(
-            "Stored reading: %s = %.1f°C",
-            mac,
-            reading.temperature,
-        )
-
-    def _cleanup_old_readings(self, mac: str) -> None:
-        """Remove readings older than HISTORY_DURATION. Must be called with lock held."""
+    def add_reading(self, reading: SensorReading) -> None:
+        """Add a new sensor reading."""
+        self.add_readings((reading,))
+
+    def add_readings(self, readings: Iterable[SensorReading]) -> None:
+        """Add several readings, taking each sensor's lock once."""
+        now_ts = time.time()
+        by_mac: dict[str, list[SensorReading]] = {}
+        for reading in readings:
+            # SensorReading.mac is already uppercase and interned
+            by_mac.setdefault(reading.mac, []).append(reading)
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for mac, mac_readings in by_mac.items():
+            lock = self._locks.get(mac) or self._add_shard(mac)
+            with lock:
+                history = self._history[mac]
+                times = self._times[mac]
+                for reading in mac_readings:
+                    history.append(reading)
+                    times.append(reading.ts)
+                if now_ts - self._last_cleanup.get(mac, 0.0) >= CLEANUP_INTERVAL_SECONDS:
+                    self._cleanup_old_readings(mac, now_ts - HISTORY_DURATION.total_seconds())
+                    self._last_cleanup[mac] = now_ts
+            self._latest[mac] = mac_readings[-1]
+            if not self._data_available.is_set():
+                self._signal_data_available()
+
+            if not debug:
+                continue
+            for reading in mac_readings:
+                logger.debug(
+                    "Stored reading: %s = %.1f°C",
+                    mac,
+                    reading.temperature,
+                )
+
+    def _cleanup_old_readings(self, mac: str, cutoff_ts: float) -> None:
+        """Remove readings older than cutoff_ts. Must be called with lock held."""
         if mac not in self._history:
             return
 
-        cutoff = datetime.now() - HISTORY_DURATION
         history = self._history[mac]
+        times = self._times[mac]
 
-        while history and history[0].timestamp < cutoff:
+        while times and times[0] < cutoff_ts:
+            times.popleft()
             history.popleft()
 
+    def _signal_data_available(self) -> None:
+        """Wake wait_for_data() callers; safe from any thread, unlike Event.set()."""
+        loop = self._waiter_loop
+        if loop is None or loop.is_closed():
+            # Nobody waiting on a loop yet, so nothing to wake
+            self._data_available.set()
+        else:
+            loop.call_soon_threadsafe(self._data_available.set)
+
+    async def wait_for_data(self, timeout: float) -> bool:
+        """Wait until the first reading is stored. Returns False on timeout."""
+        self._waiter_loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(self._data_available.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     def get_latest(self, mac: str) -> Optional[SensorReading]:
         """Get the latest reading for a sensor."""
-        mac = mac.upper()
-        with self._lock:
-            return self._latest.get(mac)
+        return self._latest.get(mac.upper())
 
     def get_all_latest(self) -> dict[str, SensorReading]:
         """Get the latest readings for all sensors."""
-        with self._lock:
-            return dict(self._latest)
+        return self._latest.copy()
 
     def get_history(
         self,
@@ -73,19 +135,37 @@ class SensorStore:
         hours: int = 24,
     ) -> list[SensorReading]:
         """Get reading history for a sensor."""
+        return self.get_history_since(mac, datetime.now() - timedelta(hours=hours))
+
+    def get_history_since(
+        self,
+        mac: str,
+        cutoff: datetime,
+    ) -> list[SensorReading]:
+        """Get readings for a sensor with timestamp >= cutoff.
+
+        History is appended in arrival order, so the start index is found
+        with a binary search instead of scanning the whole deque.
+        """
         mac = mac.upper()
-        cutoff = datetime.now() - timedelta(hours=hours)
 
-        with self._lock:
-            if mac not in self._history:
+        cutoff_ts = cutoff.timestamp()
+
+        lock = self._locks.get(mac)
+        if lock is None:
+            return []
+
+        with lock:
+            history = self._history[mac]
+            if not history:
                 return []
 
-            return [r for r in self._history[mac] if r.timestamp >= cutoff]
+            start = bisect.bisect_left(self._times[mac], cutoff_ts)
+            return list(islice(history, start, None))
 
     def get_sensor_macs(self) -> set[str]:
         """Get all MAC addresses that have readings."""
-        with self._lock:
-            return set(self._latest.keys())
+        return set(self._latest.copy())
 
     def get_reading_age(self, mac: str) -> Optional[timedelta]:
         """Get the age of the latest reading for a sensor."""
@@ -1,39 +1,112 @@
 """Configuration loading from YAML."""
 
+import json
 import logging
+import os
 from pathlib import Path
 
-import yaml
-
 from .i18n import t
 from .models import AppConfig, RemoteSiteConfig, SensorConfig, SensorType, TelegramConfig, WeatherConfig
 
 logger = logging.getLogger(__name__)
 
+# Sensor type by its config value, looked up without raising on unknown types
+_SENSOR_TYPES = {s.value: s for s in SensorType}
+
+
+def _parse_yaml(config_path: Path) -> dict:
+    """Parse YAML with the libyaml loader when PyYAML was built with it."""
+    import yaml
+
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:  # PyYAML built without libyaml
+        loader = yaml.SafeLoader
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
+def read_config_file(config_path: Path) -> dict:
+    """Parse a YAML config file into a dict (empty dict for an empty file).
+
+    The parsed result is cached next to the config as JSON, keyed on the YAML
+    file's exact mtime and size, so unchanged configs skip PyYAML. Configs
+    that don't survive a JSON round-trip unchanged are never cached.
+    """
+    cache_path = config_path.with_suffix(config_path.suffix + ".jsoncache")
+    try:
+        st = config_path.stat()
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # No usable cache
+
+    data = _parse_yaml(config_path)
+
+    try:
+        # Non-string keys, dates etc. would load differently from the cache
+        if json.loads(json.dumps(data)) != data:
+            return data
+    except (TypeError, ValueError):
+        return data
+
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.unlink(missing_ok=True)
+        # Owner-only: the config holds the Telegram bot token
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # Read-only directory
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+    return data
+
+
+def _load_sites(entries: list, kind: str) -> list[RemoteSiteConfig]:
+    """Build remote site configs, logging all invalid entries in one warning."""
+    sites = []
+    invalid = []
+    for site_data in entries:
+        try:
+            sites.append(RemoteSiteConfig(
+                name=site_data["name"],
+                url=site_data["url"].rstrip("/"),
+                poll_interval=int(site_data.get("poll_interval", 30)),
+            ))
+        except (KeyError, ValueError):
+            invalid.append(site_data)
+    if invalid:
+        logger.warning("Invalid %s configuration, skipped: %s", kind, invalid)
+    return sites
+
 
 def load_config(config_path: Path) -> AppConfig:
     """Load configuration from a YAML file."""
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-
-    if not data:
-        data = {}
+    data = read_config_file(config_path)
 
     sensors = []
+    invalid_sensors = []
     for sensor_data in data.get("sensors", []):
-        try:
-            sensor = SensorConfig(
-                mac=sensor_data["mac"],
-                name=sensor_data["name"],
-                type=SensorType(sensor_data["type"]),
-            )
-            sensors.append(sensor)
-            logger.debug("Loaded sensor: %s (%s)", sensor.name, sensor.mac)
-        except (KeyError, ValueError) as e:
-            logger.warning("Invalid sensor configuration: %s - %s", sensor_data, e)
+        sensor_type = _SENSOR_TYPES.get(sensor_data.get("type"))
+        if sensor_type is None or "mac" not in sensor_data or "name" not in sensor_data:
+            invalid_sensors.append(sensor_data)
+            continue
+        sensors.append(SensorConfig(mac=sensor_data["mac"], name=sensor_data["name"], type=sensor_type))
+    if invalid_sensors:
+        logger.warning("Invalid sensor configuration, skipped: %s", invalid_sensors)
 
     telegram_config = None
     if "telegram" in data:
@@ -76,31 +149,8 @@ def load_config(config_path: Path) -> AppConfig:
             logger.warning("Invalid api_port value: %s", api_port)
             api_port = None
 
-    remote_sites = []
-    for site_data in data.get("remote_sites", []):
-        try:
-            site = RemoteSiteConfig(
-                name=site_data["name"],
-                url=site_data["url"].rstrip("/"),
-                poll_interval=int(site_data.get("poll_interval", 30)),
-            )
-            remote_sites.append(site)
-            logger.debug("Loaded remote site: %s (%s)", site.name, site.url)
-        except (KeyError, ValueError) as e:
-            logger.warning("Invalid remote site configuration: %s - %s", site_data, e)
-
-    peers = []
-    for peer_data in data.get("peers", []):
-        try:
-            peer = RemoteSiteConfig(
-                name=peer_data["name"],
-                url=peer_data["url"].rstrip("/"),
-                poll_interval=int(peer_data.get("poll_interval", 30)),
-            )
-            peers.append(peer)
-            logger.debug("Loaded peer: %s (%s)", peer.name, peer.url)
-        except (KeyError, ValueError) as e:
-            logger.warning("Invalid peer configuration: %s - %s", peer_data, e)
+    remote_sites = _load_sites(data.get("remote_sites", []), "remote site")
+    peers = _load_sites(data.get("peers", []), "peer")
 
     config = AppConfig(
         sensors=sensors,
@@ -11,13 +11,16 @@ from typing import Optional
 from .ble.sensor_store import SensorStore
 from .db import Database
 from .formatting import format_age_long
-from .i18n import t
-from .models import AppConfig
+from .i18n import get_lang, t
+from .models import AppConfig, DeviceInfo
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_INTERVAL_SECONDS = 30
 
+# Right-aligned widths of the temperature, humidity, battery and age columns
+VALUE_WIDTHS = (7, 5, 6, 7)
+
 
 class ConsoleReporter:
     """Prints sensor readings to the console.
@@ -44,6 +47,12 @@ class ConsoleReporter:
         self._show_hidden = show_hidden
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        # Column labels and the language they were translated for
+        self._labels: tuple[str, ...] = ()
+        self._labels_lang: Optional[str] = None
+        # Local devices by MAC and the Database.devices_version they were read at
+        self._devices: dict[str, DeviceInfo] = {}
+        self._devices_version: Optional[int] = None
 
     async def start(self) -> None:
         """Start the console reporter."""
@@ -77,7 +86,12 @@ class ConsoleReporter:
 
     async def _run_timed(self) -> None:
         """Print readings at a fixed interval."""
-        await asyncio.sleep(5)  # Wait for initial data
+        await self._store.wait_for_data(5)  # Wait for initial data
+
+        # Keypress mode falls back here with interval 0 on platforms without add_reader
+        interval = self._interval or DEFAULT_INTERVAL_SECONDS
+        loop = asyncio.get_running_loop()
+        next_time = loop.time()
 
         while self._running:
             try:
@@ -85,19 +99,29 @@ class ConsoleReporter:
             except Exception as e:
                 logger.warning("Console reporter error: %s", e)
 
-            await asyncio.sleep(self._interval)
+            # Sleep to the next deadline so print time doesn't accumulate as drift;
+            # deadlines missed by a slow print are skipped, not caught up
+            next_time += interval
+            now = loop.time()
+            if next_time <= now:
+                next_time += ((now - next_time) // interval + 1) * interval
+            await asyncio.sleep(next_time - now)
 
     async def _run_keypress(self) -> None:
         """Print readings when Enter is pressed."""
         print(t("console_press_enter"))
-        await asyncio.sleep(3)  # Wait for initial data
+        await self._store.wait_for_data(3)  # Wait for initial data
 
         loop = asyncio.get_running_loop()
-        event = asyncio.Event()
+        # One pending keypress is kept; presses during a print are not lost
+        presses: asyncio.Queue[None] = asyncio.Queue(maxsize=1)
 
         def _on_stdin() -> None:
             sys.stdin.readline()
-            event.set()
+            try:
+                presses.put_nowait(None)
+            except asyncio.QueueFull:
+                pass  # A print is already pending
 
         try:
             loop.add_reader(sys.stdin, _on_stdin)
@@ -108,8 +132,7 @@ class ConsoleReporter:
             return
 
         while self._running:
-            event.clear()
-            await event.wait()
+            await presses.get()
             if self._running:
                 try:
                     self._print_readings()
@@ -124,13 +147,11 @@ class ConsoleReporter:
             return
 
         now = datetime.now()
-        devices = self._db.get_all_devices(include_hidden=self._show_hidden)
-        device_map = {d.mac: d for d in devices}
+        device_map = self._device_map()
 
         # Filter out hidden devices from readings
         if not self._show_hidden:
-            all_devs = self._db.get_all_devices(include_hidden=True)
-            hidden_macs = {d.mac for d in all_devs if d.hidden}
+            hidden_macs = {mac for mac, d in device_map.items() if d.hidden}
         else:
             hidden_macs = set()
 
@@ -158,35 +179,26 @@ class ConsoleReporter:
             rows.append((name, temp, humidity, battery, age_str))
 
         # Print table
-        col_sensor = t("console_col_sensor")
-        col_temp = t("console_col_temp")
-        col_hum = t("console_col_humidity")
-        col_batt = t("console_col_battery")
-        col_age = t("console_col_age")
-
-        name_w = max(len(r[0]) for r in rows)
-        name_w = max(name_w, len(col_sensor))
-
-        header = f"{col_sensor:<{name_w}}  {col_temp:>7}  {col_hum:>5}  {col_batt:>6}  {col_age:>7}"
-        separator = "-" * len(header)
-
-        lines = [
-            "",
-            f"[{now.strftime('%H:%M:%S')}] {t('console_header', count=len(rows))}",
-            separator,
-            header,
-            separator,
-        ]
-        for name, temp, hum, batt, age in rows:
-            lines.append(f"{name:<{name_w}}  {temp:>7}  {hum:>5}  {batt:>6}  {age:>7}")
-        lines.append(separator)
+        title = f"[{now.strftime('%H:%M:%S')}] {t('console_header', count=len(rows))}"
+        lines = self._table_lines(title, rows)
 
-        print("\n".join(lines))
-
-        # Print remote sites
+        # Append remote sites to the same frame
         if self._remote:
             for site_name, site_data in self._remote.get_all_site_data().items():
-                self._print_remote_site(site_name, site_data)
+                lines.extend(self._remote_site_lines(site_name, site_data))
+
+        # Write the whole frame at once instead of one print() per table
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def _device_map(self) -> dict[str, DeviceInfo]:
+        """Get local devices by MAC, re-reading the database only after device changes."""
+        version = self._db.devices_version
+        if version != self._devices_version:
+            devices = self._db.get_all_devices(include_hidden=True)
+            self._devices = {d.mac: d for d in devices}
+            self._devices_version = version
+        return self._devices
 
     def _is_peer_site(self, site_name: str) -> bool:
         """Check if a remote site is a bidirectional peer."""
@@ -194,22 +206,23 @@ class ConsoleReporter:
             return False
         return self._remote.is_peer(site_name) or self._remote.is_incoming_peer(site_name)
 
-    def _print_remote_site(self, site_name: str, site_data: object) -> None:
-        """Print a remote site's sensor readings."""
+    def _remote_site_lines(self, site_name: str, site_data: object) -> list[str]:
+        """Format a remote site's sensor readings as output lines."""
         now = datetime.now()
+        lines: list[str] = []
 
         if not site_data.online:
             if site_data.sensors and site_data.last_fetch:
                 # Show cached data with last seen age
                 last_seen_age = (now - site_data.last_fetch).total_seconds()
                 age_str = format_age_long(last_seen_age)
-                print(f"\n  [{site_data.site_name}] {t('remote_offline')} - {t('remote_last_seen', age=age_str)}")
+                lines.extend(("", f"  [{site_data.site_name}] {t('remote_offline')} - {t('remote_last_seen', age=age_str)}"))
             else:
-                print(f"\n  [{site_data.site_name}] {t('remote_offline')}")
-                return
+                lines.extend(("", f"  [{site_data.site_name}] {t('remote_offline')}"))
+                return lines
 
         if not site_data.sensors:
-            return
+            return lines
 
         rows: list[tuple[str, str, str, str, str]] = []
         for s in site_data.sensors:
@@ -235,34 +248,46 @@ class ConsoleReporter:
             rows.append((s.name, temp, humidity, battery, age_str))
 
         if not rows:
-            return
-
-        col_sensor = t("console_col_sensor")
-        col_temp = t("console_col_temp")
-        col_hum = t("console_col_humidity")
-        col_batt = t("console_col_battery")
-        col_age = t("console_col_age")
-
-        name_w = max(len(r[0]) for r in rows)
-        name_w = max(name_w, len(col_sensor))
+            return lines
 
         fetch_info = ""
         if site_data.last_fetch:
             fetch_age = (now - site_data.last_fetch).total_seconds()
             fetch_info = f" ({t('remote_fetched_ago', age=f'{int(fetch_age)}s')})"
 
-        header = f"{col_sensor:<{name_w}}  {col_temp:>7}  {col_hum:>5}  {col_batt:>6}  {col_age:>7}"
+        title = f"[{'⇄' if self._is_peer_site(site_name) else '→'} {site_data.site_name}] {len(rows)} sensors{fetch_info}"
+        lines.extend(self._table_lines(title, rows))
+        return lines
+
+    def _column_labels(self) -> tuple[str, ...]:
+        """Get the table column labels, translated again only when the language changes."""
+        lang = get_lang()
+        if lang != self._labels_lang:
+            self._labels = (
+                t("console_col_sensor"),
+                t("console_col_temp"),
+                t("console_col_humidity"),
+                t("console_col_battery"),
+                t("console_col_age"),
+            )
+            self._labels_lang = lang
+        return self._labels
+
+    def _table_lines(self, title: str, rows: list[tuple[str, str, str, str, str]]) -> list[str]:
+        """Format rows as a table under a title line."""
+        labels = self._column_labels()
+        name_w = max(len(labels[0]), max((len(r[0]) for r in rows), default=0))
+
+        def format_row(row: tuple[str, ...]) -> str:
+            name, *values = row
+            return "  ".join(
+                [name.ljust(name_w)] + [v.rjust(w) for v, w in zip(values, VALUE_WIDTHS)]
+            )
+
+        header = format_row(labels)
         separator = "-" * len(header)
 
-        output = [
-            "",
-            f"[{'⇄' if self._is_peer_site(site_name) else '→'} {site_data.site_name}] {len(rows)} sensors{fetch_info}",
-            separator,
-            header,
-            separator,
-        ]
-        for name, temp, hum, batt, age in rows:
-            output.append(f"{name:<{name_w}}  {temp:>7}  {hum:>5}  {batt:>6}  {age:>7}")
-        output.append(separator)
-
-        print("\n".join(output))
+        lines = ["", title, separator, header, separator]
+        lines.extend(map(format_row, rows))
+        lines.append(separator)
+        return lines
@@ -6,12 +6,12 @@ import logging
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 if TYPE_CHECKING:
     from .models import SensorConfig
 
-from .formatting import compute_cutoff
+from .formatting import compute_cutoff, format_db_timestamp
 from .models import DeviceInfo
 
 logger = logging.getLogger(__name__)
@@ -25,14 +25,30 @@ class Database:
     def __init__(self, db_path: Path = DEFAULT_DB_PATH) -> None:
         self._db_path = db_path
         self._conn: Optional[sqlite3.Connection] = None
+        self._devices_version = 0
 
     def connect(self) -> None:
         """Connect to database and create tables."""
         logger.info("Connecting to database: %s", self._db_path)
         self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
+        # WAL lets readers (e.g. widget_output) run alongside writes, and
+        # synchronous=NORMAL is durable in WAL mode with fewer fsyncs.
+        # cache_size is in KiB when negative (~20 MB of page cache).
+        self._conn.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-20000;"
+            "PRAGMA mmap_size=268435456;"
+        )
         self._create_tables()
 
+    @property
+    def devices_version(self) -> int:
+        """Counter bumped on every devices table write, for caching device lookups."""
+        return self._devices_version
+
     def close(self) -> None:
         """Close database connection."""
         if self._conn:
@@ -60,10 +76,13 @@ class Database:
                 UNIQUE(mac, timestamp)
             )
         """)
+        # Covers the history, graph and stats queries so they never read table rows.
+        # (mac, timestamp) lookups alone are served by the UNIQUE constraint's index.
         self._conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_readings_mac_time
-            ON readings(mac, timestamp)
+            CREATE INDEX IF NOT EXISTS idx_readings_cover
+            ON readings(mac, timestamp, temp_avg, temp_min, temp_max, humidity_avg)
         """)
+        self._conn.execute("DROP INDEX IF EXISTS idx_readings_mac_time")
 
         # Devices table for aliases and ordering
         self._conn.execute("""
@@ -147,6 +166,17 @@ class Database:
         ).fetchone()
         return row["value"] if row else None
 
+    def get_settings(self, keys: Iterable[str]) -> dict[str, str]:
+        """Get several settings in one query. Missing keys are omitted."""
+        keys = list(keys)
+        if not self._conn or not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        rows = self._conn.execute(
+            f"SELECT key, value FROM settings WHERE key IN ({placeholders})", keys
+        ).fetchall()
+        return {row["key"]: row["value"] for row in rows}
+
     def set_setting(self, key: str, value: str) -> None:
         """Set a setting value (insert or update)."""
         if not self._conn:
@@ -157,6 +187,16 @@ class Database:
         )
         self._conn.commit()
 
+    def set_settings(self, settings: dict[str, str]) -> None:
+        """Set several settings in a single transaction."""
+        if not self._conn or not settings:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            settings.items(),
+        )
+        self._conn.commit()
+
     def save_aggregated_reading(
         self,
         mac: str,
@@ -171,34 +211,58 @@ class Database:
         sample_count: int = 1,
     ) -> None:
         """Save an aggregated reading to the database."""
-        if not self._conn:
+        self.save_aggregated_readings([{
+            "mac": mac,
+            "timestamp": timestamp,
+            "temp_avg": temp_avg,
+            "temp_min": temp_min,
+            "temp_max": temp_max,
+            "humidity_avg": humidity_avg,
+            "pressure_avg": pressure_avg,
+            "battery_voltage": battery_voltage,
+            "battery_percent": battery_percent,
+            "sample_count": sample_count,
+        }])
+
+    def save_aggregated_readings(self, readings: list[dict]) -> None:
+        """Save several aggregated readings in a single transaction.
+
+        Each dict takes the same keys as save_aggregated_reading() arguments.
+        """
+        if not self._conn or not readings:
             return
 
+        rows = [
+            (
+                r["mac"].upper(),
+                format_db_timestamp(r["timestamp"]),
+                r["temp_avg"],
+                r["temp_min"],
+                r["temp_max"],
+                r.get("humidity_avg"),
+                r.get("pressure_avg"),
+                r.get("battery_voltage"),
+                r.get("battery_percent"),
+                r.get("sample_count", 1),
+            )
+            for r in readings
+        ]
+
         try:
-            self._conn.execute(
+            self._conn.executemany(
                 """
                 INSERT OR REPLACE INTO readings
                 (mac, timestamp, temp_avg, temp_min, temp_max, humidity_avg,
                  pressure_avg, battery_voltage, battery_percent, sample_count)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    mac.upper(),
-                    timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-                    temp_avg,
-                    temp_min,
-                    temp_max,
-                    humidity_avg,
-                    pressure_avg,
-                    battery_voltage,
-                    battery_percent,
-                    sample_count,
-                ),
+                rows,
             )
             self._conn.commit()
-            logger.debug("Saved aggregated reading for %s", mac)
+            logger.debug("Saved %d aggregated reading(s)", len(rows))
         except Exception as e:
-            logger.error("Error saving reading: %s", e)
+            self._conn.rollback()
+            logger.error("Error saving readings: %s", e)
 
     def get_history(
         self,
@@ -219,7 +283,7 @@ class Database:
             WHERE mac = ? AND timestamp >= ?
             ORDER BY timestamp ASC
             """,
-            (mac.upper(), cutoff.strftime("%Y-%m-%d %H:%M:%S")),
+            (mac.upper(), format_db_timestamp(cutoff)),
         )
 
         return [dict(row) for row in cursor.fetchall()]
@@ -249,7 +313,7 @@ class Database:
             FROM readings
             WHERE mac = ? AND timestamp >= ?
             """,
-            (mac.upper(), cutoff.strftime("%Y-%m-%d %H:%M:%S")),
+            (mac.upper(), format_db_timestamp(cutoff)),
         )
 
         row = cursor.fetchone()
@@ -275,11 +339,11 @@ class Database:
             WHERE mac = ? AND timestamp >= ?
             ORDER BY timestamp ASC
             """,
-            (mac.upper(), cutoff.strftime("%Y-%m-%d %H:%M:%S")),
+            (mac.upper(), format_db_timestamp(cutoff)),
         )
 
         return [
-            (datetime.strptime(row["timestamp"], "%Y-%m-%d %H:%M:%S"), row["temp_avg"])
+            (datetime.fromisoformat(row["timestamp"]), row["temp_avg"])
             for row in cursor.fetchall()
         ]
 
@@ -291,7 +355,7 @@ class Database:
         cutoff = compute_cutoff(days=days)
         cursor = self._conn.execute(
             "DELETE FROM readings WHERE timestamp < ?",
-            (cutoff.strftime("%Y-%m-%d %H:%M:%S"),),
+            (format_db_timestamp(cutoff),),
         )
         self._conn.commit()
         return cursor.rowcount
@@ -364,6 +428,7 @@ class Database:
                 (alias, mac.upper()),
             )
             self._conn.commit()
+            self._devices_version += 1
             return cursor.rowcount > 0
         except Exception as e:
             logger.error("Error setting device alias: %s", e)
@@ -383,6 +448,7 @@ class Database:
                 (order, mac.upper()),
             )
             self._conn.commit()
+            self._devices_version += 1
             return self._conn.total_changes > 0
         except Exception as e:
             logger.error("Error setting device order: %s", e)
@@ -402,6 +468,7 @@ class Database:
                 (1 if hidden else 0, mac.upper()),
             )
             self._conn.commit()
+            self._devices_version += 1
             return cursor.rowcount > 0
         except Exception as e:
             logger.error("Error setting device hidden: %s", e)
@@ -526,6 +593,7 @@ class Database:
                 next_order += 1
 
         self._conn.commit()
+        self._devices_version += 1
 
     def sync_remote_devices(self, site_name: str, sensors: list[dict]) -> None:
         """Sync remote device names from peer into devices table.
@@ -547,6 +615,7 @@ class Database:
             # Get next available order number (shared sequence with local devices)
             row = self._conn.execute("SELECT MAX(display_order) FROM devices").fetchone()
             next_order = (row[0] or 0) + 1
+            changed = False
 
             for s in sensors:
                 mac = s.get("mac", "").upper()
@@ -556,14 +625,17 @@ class Database:
                 sensor_type = s.get("type", "unknown")
 
                 if mac in existing:
-                    self._conn.execute(
+                    # Only rows whose name or type actually differ count as changed
+                    cursor = self._conn.execute(
                         """
                         UPDATE devices SET alias = ?, sensor_type = ?,
                             updated_at = CURRENT_TIMESTAMP
                         WHERE mac = ? AND site = ?
+                            AND (alias IS NOT ? OR sensor_type IS NOT ?)
                         """,
-                        (name, sensor_type, mac, site_name),
+                        (name, sensor_type, mac, site_name, name, sensor_type),
                     )
+                    changed = changed or cursor.rowcount > 0
                 else:
                     self._conn.execute(
                         """
@@ -573,8 +645,11 @@ class Database:
                         (mac, name, next_order, sensor_type, site_name),
                     )
                     next_order += 1
+                    changed = True
 
             self._conn.commit()
+            if changed:
+                self._devices_version += 1
             logger.debug("Synced %d remote devices for site %s", len(sensors), site_name)
         except Exception as e:
             logger.error("Error syncing remote devices for %s: %s", site_name, e)
@@ -627,7 +702,7 @@ class Database:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
-                    timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+                    format_db_timestamp(timestamp),
                     temperature,
                     humidity,
                     pressure,
@@ -662,7 +737,7 @@ class Database:
             WHERE timestamp >= ?
             ORDER BY timestamp ASC
             """,
-            (cutoff.strftime("%Y-%m-%d %H:%M:%S"),),
+            (format_db_timestamp(cutoff),),
         )
 
         return [dict(row) for row in cursor.fetchall()]
@@ -693,7 +768,7 @@ class Database:
             FROM weather
             WHERE timestamp >= ?
             """,
-            (cutoff.strftime("%Y-%m-%d %H:%M:%S"),),
+            (format_db_timestamp(cutoff),),
         )
 
         row = cursor.fetchone()
@@ -739,10 +814,10 @@ class Database:
             WHERE timestamp >= ?
             ORDER BY timestamp ASC
             """,
-            (cutoff.strftime("%Y-%m-%d %H:%M:%S"),),
+            (format_db_timestamp(cutoff),),
         )
 
         return [
-            (datetime.strptime(row["timestamp"], "%Y-%m-%d %H:%M:%S"), row["temperature"])
+            (datetime.fromisoformat(row["timestamp"]), row["temperature"])
             for row in cursor.fetchall()
         ]
@@ -86,6 +86,14 @@ def compute_cutoff(
         return datetime.now() - timedelta(hours=default_hours)
 
 
+def format_db_timestamp(dt: datetime) -> str:
+    """Format as 'YYYY-MM-DD HH:MM:SS' (DB and API text) without going through strftime.
+
+    Slicing drops any UTC offset, matching the strftime output for aware datetimes.
+    """
+    return dt.isoformat(" ", "seconds")[:19]
+
+
 def build_remote_device_list(
     remote: object,
 ) -> list[tuple[str, str, str, str]]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -15,7 +16,7 @@ class SensorType(Enum):
     XIAOMI = "xiaomi"
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorConfig:
     """Configuration for a single sensor."""
 
@@ -24,12 +25,13 @@ class SensorConfig:
     type: SensorType
 
     def __post_init__(self) -> None:
-        self.mac = self.mac.upper()
+        # Interned so config, store and parser keys share one string per MAC
+        self.mac = sys.intern(self.mac.upper())
         if isinstance(self.type, str):
             self.type = SensorType(self.type)
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorReading:
     """A single sensor reading."""
 
@@ -41,9 +43,14 @@ class SensorReading:
     battery_percent: Optional[int] = None
     pressure: Optional[float] = None
     rssi: Optional[int] = None
+    # POSIX seconds of timestamp, computed once for cheap age/range arithmetic
+    ts: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        self.mac = self.mac.upper()
+        # The scanner passes MACs already uppercased and interned; only normalize others
+        if not self.mac.isupper():
+            self.mac = self.mac.upper()
+        self.ts = self.timestamp.timestamp()
 
 
 @dataclass
@@ -6,7 +6,7 @@ import asyncio
 import json
 import logging
 from dataclasses import asdict, dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Callable, Optional
 
 import aiohttp
@@ -15,6 +15,9 @@ from .models import RemoteSiteConfig
 
 logger = logging.getLogger(__name__)
 
+# Per-request timeout for remote site and peer requests
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
 
 @dataclass
 class RemoteSensor:
@@ -114,14 +117,18 @@ class RemotePoller:
         peers: Optional[list[RemoteSiteConfig]] = None,
         db=None,
         local_status_fn: Optional[Callable[[], dict]] = None,
+        session: Optional[aiohttp.ClientSession] = None,
     ) -> None:
         self._remote_sites = remote_sites or []
         self._peers = peers or []
         self._db = db
         self._local_status_fn = local_status_fn
         self._data: dict[str, RemoteSiteData] = {}
-        self._session: Optional[aiohttp.ClientSession] = None
+        # A session passed in is shared and owned by the caller
+        self._session = session
+        self._owns_session = session is None
         self._tasks: list[asyncio.Task] = []
+        self._etags: dict[str, str] = {}
 
         # Initialize data entries for configured sites/peers
         for site in self._remote_sites + self._peers:
@@ -213,9 +220,9 @@ class RemotePoller:
 
     async def start(self) -> None:
         """Start polling all remote sites and peers."""
-        self._session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=15),
-        )
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
 
         # Start polling tasks for read-only remote sites
         for site in self._remote_sites:
@@ -251,9 +258,9 @@ class RemotePoller:
                 pass
         self._tasks.clear()
 
-        if self._session:
+        if self._session and self._owns_session:
             await self._session.close()
-            self._session = None
+        self._session = None
         logger.info("Remote poller stopped")
 
     async def _poll_loop(self, site: RemoteSiteConfig, sync: bool) -> None:
@@ -265,11 +272,53 @@ class RemotePoller:
                 await self._fetch_site(site)
             await asyncio.sleep(site.poll_interval)
 
+    def _conditional_headers(self, site_name: str) -> dict[str, str]:
+        """Build If-None-Match headers so unchanged payloads come back as 304."""
+        etag = self._etags.get(site_name)
+        # Only send when we still hold the data the ETag refers to
+        if etag and self._data[site_name].sensors:
+            return {"If-None-Match": etag}
+        return {}
+
+    def _remember_etag(self, site_name: str, resp: aiohttp.ClientResponse) -> None:
+        """Store the response ETag for the next conditional request."""
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._etags[site_name] = etag
+        else:
+            self._etags.pop(site_name, None)
+
+    def _mark_not_modified(self, site_name: str) -> None:
+        """Handle a 304 response: cached data is still current.
+
+        The ETag ignores sensor ages, so the cached ages are advanced by the
+        time since the last fetch to keep them matching the remote site.
+        """
+        site_data = self._data[site_name]
+        if site_data.last_fetch:
+            # Whole seconds, advancing last_fetch by the same amount so no drift accumulates
+            elapsed = int((datetime.now() - site_data.last_fetch).total_seconds())
+            for sensor in site_data.sensors:
+                if sensor.age_seconds is not None:
+                    sensor.age_seconds += elapsed
+            site_data.last_fetch += timedelta(seconds=elapsed)
+        else:
+            site_data.last_fetch = datetime.now()
+        site_data.online = True
+        site_data.last_error = None
+        logger.debug("Remote site %s not modified", site_name)
+
     async def _fetch_site(self, site: RemoteSiteConfig) -> None:
         """Fetch status from a remote site (read-only GET)."""
         url = f"{site.url}/api/v1/status"
         try:
-            async with self._session.get(url) as resp:
+            async with self._session.get(
+                url, headers=self._conditional_headers(site.name), timeout=REQUEST_TIMEOUT,
+            ) as resp:
+                if resp.status == 304:
+                    self._mark_not_modified(site.name)
+                    return
+
                 if resp.status != 200:
                     self._data[site.name].online = False
                     self._data[site.name].last_error = f"HTTP {resp.status}"
@@ -277,6 +326,7 @@ class RemotePoller:
                     return
 
                 data = await resp.json()
+                self._remember_etag(site.name, resp)
 
             self._data[site.name] = _parse_site_data(data, site.name)
             self._save_cache_to_db(site.name)
@@ -302,7 +352,7 @@ class RemotePoller:
         local_data = self._local_status_fn() if self._local_status_fn else {}
 
         try:
-            async with self._session.post(url, json=local_data) as resp:
+            async with self._session.post(url, json=local_data, timeout=REQUEST_TIMEOUT) as resp:
                 if resp.status == 404:
                     # Peer doesn't support sync yet — fall back to GET
                     logger.info("Peer %s doesn't support sync, falling back to GET", site.name)
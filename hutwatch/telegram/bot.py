@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Optional
 
@@ -42,6 +43,7 @@ class TelegramBot:
         self._weather = weather
         self._alert_manager = alert_manager
         self._app: Optional[Application] = None
+        self._started = asyncio.Event()
         self._commands = CommandHandlers(config, store, db, weather, remote=remote, alert_manager=alert_manager)
         self._scheduler = ReportScheduler(config, store, self._commands, weather, remote=remote)
 
@@ -107,10 +109,20 @@ class TelegramBot:
         await self._app.start()
         await self._app.updater.start_polling(allowed_updates=Update.ALL_TYPES)
 
+        self._started.set()
         logger.info("Telegram bot started")
 
+    async def wait_started(self, timeout: float) -> bool:
+        """Wait until the bot is connected. Returns False on timeout."""
+        try:
+            await asyncio.wait_for(self._started.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     async def stop(self) -> None:
         """Stop the Telegram bot."""
+        self._started.clear()
         if self._app:
             logger.info("Stopping Telegram bot...")
             await self._app.updater.stop()
@@ -143,8 +155,6 @@ class TelegramBot:
 
         Uses exponential backoff for restart delays.
         """
-        import asyncio
-
         current_delay = restart_delay
 
         while True:
@@ -308,7 +308,7 @@ class TuiDashboard:
         sys.stdout.flush()
 
         # Wait for initial data
-        await asyncio.sleep(3)
+        await self._store.wait_for_data(3)
 
         try:
             while self._running:
@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+from dataclasses import asdict
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import aiohttp
 
 from .models import WeatherConfig, WeatherData
 
+if TYPE_CHECKING:
+    from .db import Database
+
 logger = logging.getLogger(__name__)
 
 # MET Norway API base URL
 API_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
 
+# Settings key for the persisted last successful response
+CACHE_SETTING_KEY = "weather_cache"
+
+# Cached weather younger than this is served without a network request
+CACHE_MAX_AGE_SECONDS = 1800
+
 # User-Agent is required by MET Norway API
 def _get_user_agent() -> str:
     from . import __version__
@@ -64,11 +75,21 @@ def get_weather_emoji(symbol_code: Optional[str]) -> str:
 class WeatherFetcher:
     """Fetches weather data from MET Norway API."""
 
-    def __init__(self, config: WeatherConfig) -> None:
+    def __init__(
+        self,
+        config: WeatherConfig,
+        db: Optional["Database"] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
         self._config = config
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._db = db
+        # A session passed in is shared and owned by the caller
+        self._session = session
+        self._owns_session = session is None
         self._latest: Optional[WeatherData] = None
         self._last_fetch: Optional[datetime] = None
+        # Last-Modified of the current forecast, sent back as If-Modified-Since
+        self._last_modified: Optional[str] = None
 
     @property
     def latest(self) -> Optional[WeatherData]:
@@ -86,27 +107,48 @@ class WeatherFetcher:
         return self._config.location_name
 
     async def start(self) -> None:
-        """Initialize the HTTP session."""
+        """Initialize the HTTP session and restore cached weather."""
         if self._session is None:
-            self._session = aiohttp.ClientSession(
-                headers={"User-Agent": _get_user_agent()}
-            )
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        if self._latest is None:
+            self._load_cache()
 
     async def stop(self) -> None:
-        """Close the HTTP session."""
-        if self._session:
+        """Close the HTTP session if this fetcher created it."""
+        if self._session and self._owns_session:
             await self._session.close()
-            self._session = None
+        self._session = None
 
-    async def fetch(self) -> Optional[WeatherData]:
-        """Fetch current weather data from API."""
+    async def fetch(self, force: bool = False) -> Optional[WeatherData]:
+        """Fetch current weather data from API.
+
+        Returns the cached weather instead if it is younger than
+        CACHE_MAX_AGE_SECONDS, unless force is set.
+        """
         if not self._session:
             await self.start()
 
+        if not force and self._latest and self._last_fetch:
+            age = (datetime.now() - self._last_fetch).total_seconds()
+            if age < CACHE_MAX_AGE_SECONDS:
+                logger.debug("Using cached weather (%.0fs old)", age)
+                return self._latest
+
         url = f"{API_URL}?lat={self._config.latitude}&lon={self._config.longitude}"
+        headers = {"User-Agent": _get_user_agent()}
+        if self._latest and self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
 
         try:
-            async with self._session.get(url) as response:
+            async with self._session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    # Forecast unchanged since the last fetch
+                    self._last_fetch = datetime.now()
+                    self._save_cache()
+                    logger.debug("Weather not modified")
+                    return self._latest
+
                 if response.status != 200:
                     logger.error(
                         "Weather API error: %s %s",
@@ -120,6 +162,8 @@ class WeatherFetcher:
                 if weather:
                     self._latest = weather
                     self._last_fetch = datetime.now()
+                    self._last_modified = response.headers.get("Last-Modified")
+                    self._save_cache()
                     logger.debug(
                         "Weather fetched: %.1f°C, %s",
                         weather.temperature,
@@ -137,6 +181,44 @@ class WeatherFetcher:
             logger.error("Weather fetch error: %s", e)
             return None
 
+    def _load_cache(self) -> None:
+        """Load the last persisted weather for this location from the database."""
+        if not self._db:
+            return
+        raw = self._db.get_setting(CACHE_SETTING_KEY)
+        if not raw:
+            return
+        try:
+            cached = json.loads(raw)
+            if (cached["latitude"], cached["longitude"]) != (self._config.latitude, self._config.longitude):
+                return
+            data = cached["data"]
+            data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+            self._latest = WeatherData(**data)
+            self._last_fetch = datetime.fromisoformat(cached["last_fetch"])
+            self._last_modified = cached.get("last_modified")
+            logger.info("Loaded cached weather from %s", self._last_fetch.strftime("%H:%M"))
+        except Exception as e:
+            logger.warning("Failed to load weather cache: %s", e)
+
+    def _save_cache(self) -> None:
+        """Persist the latest weather so restarts don't need a network request."""
+        if not self._db or not self._latest or not self._last_fetch:
+            return
+        try:
+            data = asdict(self._latest)
+            data["timestamp"] = self._latest.timestamp.isoformat()
+            cache = {
+                "latitude": self._config.latitude,
+                "longitude": self._config.longitude,
+                "last_fetch": self._last_fetch.isoformat(),
+                "last_modified": self._last_modified,
+                "data": data,
+            }
+            self._db.set_setting(CACHE_SETTING_KEY, json.dumps(cache))
+        except Exception as e:
+            logger.warning("Failed to save weather cache: %s", e)
+
     def _parse_response(self, data: dict) -> Optional[WeatherData]:
         """Parse API response into WeatherData."""
         try:
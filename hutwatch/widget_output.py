@@ -101,7 +101,7 @@ def generate_output(db_path: Path) -> dict:
                 entry["timestamp"] = reading["timestamp"]
                 # Calculate age in seconds
                 try:
-                    ts = datetime.strptime(reading["timestamp"], "%Y-%m-%d %H:%M:%S")
+                    ts = datetime.fromisoformat(reading["timestamp"])
                     entry["age_seconds"] = int((now - ts).total_seconds())
                 except (ValueError, TypeError):
                     entry["age_seconds"] = None